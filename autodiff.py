@@ -0,0 +1,163 @@
+import numpy as np
+
+def reduce(gradient, shape):
+    while gradient.ndim > len(shape):
+        gradient = gradient.sum(axis=0)
+    for axis, size in enumerate(shape):
+        if size == 1 and gradient.shape[axis] != 1:
+            gradient = gradient.sum(axis=axis, keepdims=True)
+    return gradient
+
+def lift(operand):
+    return operand if isinstance(operand, Variable) else Variable(np.asarray(operand, dtype=float))
+
+class Variable:
+    __array_priority__ = 100
+
+    def __init__(self, value, parents=()):
+        self.value = np.asarray(value, dtype=float)
+        self.parents = parents
+
+    @property
+    def shape(self):
+        return self.value.shape
+
+    @property
+    def ndim(self):
+        return self.value.ndim
+
+    def __len__(self):
+        return len(self.value)
+
+    def __add__(self, other):
+        other = lift(other)
+        return Variable(self.value + other.value, (
+            (self, lambda upstream: upstream),
+            (other, lambda upstream: upstream),
+        ))
+
+    def __sub__(self, other):
+        other = lift(other)
+        return Variable(self.value - other.value, (
+            (self, lambda upstream: upstream),
+            (other, lambda upstream: -upstream),
+        ))
+
+    def __mul__(self, other):
+        other = lift(other)
+        return Variable(self.value * other.value, (
+            (self, lambda upstream: upstream * other.value),
+            (other, lambda upstream: upstream * self.value),
+        ))
+
+    def __truediv__(self, other):
+        other = lift(other)
+        return Variable(self.value / other.value, (
+            (self, lambda upstream: upstream / other.value),
+            (other, lambda upstream: -upstream * self.value / other.value ** 2),
+        ))
+
+    def __pow__(self, exponent):
+        if isinstance(exponent, Variable):
+            raise TypeError("Solo se admiten exponentes constantes.")
+        return Variable(self.value ** exponent, (
+            (self, lambda upstream: upstream * exponent * self.value ** (exponent - 1)),
+        ))
+
+    def __neg__(self):
+        return Variable(-self.value, ((self, lambda upstream: -upstream),))
+
+    def __radd__(self, other):
+        return lift(other) + self
+
+    def __rsub__(self, other):
+        return lift(other) - self
+
+    def __rmul__(self, other):
+        return lift(other) * self
+
+    def __rtruediv__(self, other):
+        return lift(other) / self
+
+    def __getitem__(self, index):
+        def backward(upstream):
+            gradient = np.zeros_like(self.value)
+            np.add.at(gradient, index, upstream)
+            return gradient
+        return Variable(self.value[index], ((self, backward),))
+
+    def sin(self):
+        return Variable(np.sin(self.value), ((self, lambda upstream: upstream * np.cos(self.value)),))
+
+    def cos(self):
+        return Variable(np.cos(self.value), ((self, lambda upstream: -upstream * np.sin(self.value)),))
+
+    def sum(self, axis=None):
+        def backward(upstream):
+            if axis is not None:
+                upstream = np.expand_dims(upstream, axis)
+            return np.broadcast_to(upstream, self.value.shape)
+        return Variable(np.sum(self.value, axis=axis), ((self, backward),))
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        if method != "__call__" or kwargs:
+            return NotImplemented
+        if ufunc in UNARY:
+            return UNARY[ufunc](lift(inputs[0]))
+        if ufunc in BINARY:
+            return BINARY[ufunc](lift(inputs[0]), inputs[1])
+        return NotImplemented
+
+    def __array_function__(self, function, types, arguments, kwargs):
+        if function is np.sum:
+            return lift(arguments[0]).sum(**kwargs)
+        return NotImplemented
+
+UNARY = {
+    np.sin: Variable.sin,
+    np.cos: Variable.cos,
+    np.negative: Variable.__neg__,
+}
+
+BINARY = {
+    np.add: Variable.__add__,
+    np.subtract: Variable.__sub__,
+    np.multiply: Variable.__mul__,
+    np.true_divide: Variable.__truediv__,
+    np.power: Variable.__pow__,
+}
+
+def order(output):
+    visited = set()
+    sequence = []
+    pending = [(output, False)]
+    while pending:
+        node, expanded = pending.pop()
+        if expanded:
+            sequence.append(node)
+            continue
+        if id(node) in visited:
+            continue
+        visited.add(id(node))
+        pending.append((node, True))
+        for parent, _ in node.parents:
+            pending.append((parent, False))
+    return reversed(sequence)
+
+def backpropagate(output):
+    gradients = {id(output): np.ones_like(output.value)}
+    for node in order(output):
+        upstream = gradients.pop(id(node), None)
+        if upstream is None:
+            continue
+        for parent, backward in node.parents:
+            contribution = reduce(np.asarray(backward(upstream), dtype=float), parent.value.shape)
+            gradients[id(parent)] = gradients.get(id(parent), 0) + contribution
+        if not node.parents:
+            gradients[id(node)] = upstream
+    return gradients
+
+def gradient(objective, point):
+    variable = Variable(np.array(point, dtype=float))
+    output = lift(objective(variable))
+    return backpropagate(output).get(id(variable), np.zeros_like(variable.value))
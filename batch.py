@@ -0,0 +1,147 @@
+import argparse
+import contextlib
+import io
+import json
+import sys
+import numpy as np
+import caching
+import functions
+import input_parser
+import main
+import optimizer
+import parallel
+import persistence
+from history import History
+
+PRECISIONS = ("float64", "float32")
+
+def parse_job(job):
+    name, suggested_dimension, function, bounds, defaults, global_minimum, batched = functions.find(job.get("function", ""))
+    default_rate, default_iterations, default_tolerance = defaults
+
+    dimension = suggested_dimension
+    if "dimension" in job:
+        dimension = input_parser.parse_positive_integer(str(job["dimension"]), "dimensión")
+    if dimension is None:
+        raise ValueError("dimensión es obligatorio.")
+    if suggested_dimension is not None and dimension != suggested_dimension:
+        raise ValueError(f"{function.__name__} solo admite dimensión {suggested_dimension}.")
+
+    learning_rate = input_parser.parse_float(str(job.get("learning_rate", default_rate)), "tasa de aprendizaje")
+    maximum_iterations = input_parser.parse_positive_integer(str(job.get("maximum_iterations", default_iterations)), "máximo de iteraciones")
+    convergence_threshold = input_parser.parse_float(str(job.get("convergence_threshold", default_tolerance)), "criterio de paro")
+
+    restart_count = 0
+    if job.get("restarts"):
+        restart_count = input_parser.parse_positive_integer(str(job["restarts"]), "reinicios")
+
+    seed = job.get("seed")
+    if seed is not None:
+        seed = input_parser.parse_non_negative_integer(str(seed), "semilla")
+
+    if "initial_point" in job:
+        if not isinstance(job["initial_point"], list):
+            raise ValueError("initial_point debe ser una lista de valores numéricos.")
+        initial_point = input_parser.parse_vector(" ".join(str(value) for value in job["initial_point"]), dimension)
+        if not main.is_within_bounds(initial_point, bounds):
+            raise ValueError(f"Punto fuera del dominio [{bounds[0]}, {bounds[1]}].")
+    else:
+        initial_point = optimizer.sample_point(bounds, dimension, np.random.default_rng(seed))
+
+    gradient = input_parser.parse_choice(str(job.get("gradient", "finite")), optimizer.GRADIENTS, "gradiente")
+    precision = input_parser.parse_choice(str(job.get("dtype", "float64")), PRECISIONS, "precisión")
+    method = input_parser.parse_choice(str(job.get("method", "steepest")), optimizer.METHODS, "método")
+    line_search = input_parser.parse_choice(str(job.get("line_search", "halving")), optimizer.LINE_SEARCHES, "búsqueda de línea")
+    optimizer.check_line_search(method, line_search)
+    retention = input_parser.parse_retention(str(job.get("history", "all")))
+    search_budget = input_parser.parse_positive_integer(str(job.get("search_budget", optimizer.SEARCH_BUDGET)), "presupuesto de búsqueda")
+
+    return {
+        "function": function, "dimension": dimension, "bounds": bounds,
+        "global_minimum": global_minimum, "batched": batched,
+        "learning_rate": learning_rate, "maximum_iterations": maximum_iterations,
+        "convergence_threshold": convergence_threshold, "initial_point": initial_point,
+        "restart_count": restart_count, "seed": seed, "gradient": gradient,
+        "method": method, "line_search": line_search, "dtype": np.dtype(precision),
+        "search_budget": search_budget, "retention": retention,
+    }
+
+def execute(job, cache=None):
+    objective = caching.CachedObjective(job["function"])
+    runner = optimizer if cache is None else cache
+    final_point, final_value, history = runner.descend(
+        objective, job["initial_point"], job["learning_rate"],
+        job["maximum_iterations"], job["convergence_threshold"],
+        bounds=job["bounds"], silent=True, batched=job["batched"], history=History(**job["retention"]),
+        gradient=job["gradient"], method=job["method"], line_search=job["line_search"],
+        dtype=job["dtype"], search_budget=job["search_budget"], seed=job["seed"]
+    )
+
+    if job["restart_count"] > 0:
+        with contextlib.redirect_stdout(io.StringIO()):
+            best_point, best_value, best_history = (main if cache is None else cache).restart(
+                objective, job["bounds"], job["dimension"], job["learning_rate"],
+                job["maximum_iterations"], job["convergence_threshold"], job["restart_count"],
+                batched=job["batched"], seed=job["seed"],
+                gradient=job["gradient"], method=job["method"], line_search=job["line_search"],
+                dtype=job["dtype"], search_budget=job["search_budget"], retention=job["retention"]
+            )
+        if best_value < final_value:
+            final_point, final_value, history = best_point, best_value, best_history
+
+    return {
+        "function": job["function"].__name__,
+        "dimension": job["dimension"],
+        "final_point": np.asarray(final_point).tolist(),
+        "final_value": float(final_value),
+        "iterations": len(history),
+        "evaluations": objective.evaluations + (0 if cache is None else cache.replayed),
+        "reached": bool(functions.reaches(final_value, job["global_minimum"])),
+        "cached": cache is not None and cache.misses == 0,
+    }
+
+def process(line, cache_directory=None, cache_bytes=persistence.MAXIMUM_BYTES):
+    job = {}
+    try:
+        job = json.loads(line)
+        if not isinstance(job, dict):
+            job = {}
+            raise ValueError("Cada línea debe ser un objeto JSON.")
+        cache = None if cache_directory is None else persistence.ResultCache(cache_directory, cache_bytes)
+        return {"id": job.get("id"), **execute(parse_job(job), cache)}
+    except ValueError as error:
+        return {"id": job.get("id"), "error": str(error)}
+    except Exception as error:
+        return {"id": job.get("id"), "error": f"{type(error).__name__}: {error}"}
+
+def read_jobs(filepath):
+    with open(filepath) as file:
+        return [line for line in file if line.strip()]
+
+def run(jobs_path, results_path, workers=1, cache_directory=None, cache_bytes=persistence.MAXIMUM_BYTES):
+    lines = read_jobs(jobs_path)
+    failures = 0
+    with open(results_path, 'w') as file:
+        for index, result in parallel.stream(process, [(line, cache_directory, cache_bytes) for line in lines], workers):
+            failures += "error" in result
+            file.write(json.dumps({"job": index, **result}, ensure_ascii=False) + "\n")
+            file.flush()
+    print(f" {len(lines)} trabajos procesados ({failures} con error); resultados en '{results_path}'")
+    return failures
+
+def parse_arguments(arguments):
+    parser = argparse.ArgumentParser(description="Ejecuta trabajos de gradiente descendente desde un archivo JSON-lines.")
+    parser.add_argument("jobs", help="archivo de trabajos (un objeto JSON por línea)")
+    parser.add_argument("results", help="archivo de resultados (un objeto JSON por línea)")
+    parser.add_argument("--workers", type=int, default=1, help="procesos en paralelo")
+    parser.add_argument("--cache", nargs="?", const=persistence.DIRECTORY, help="directorio de la caché persistente de resultados")
+    parser.add_argument("--cache-size", type=int, default=persistence.MAXIMUM_BYTES // 2 ** 20, help="tamaño máximo de la caché en MiB")
+    return parser.parse_args(arguments)
+
+def batch(arguments=None):
+    options = parse_arguments(arguments)
+    failures = run(options.jobs, options.results, options.workers, options.cache, options.cache_size * 2 ** 20)
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(batch())
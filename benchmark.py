@@ -0,0 +1,134 @@
+import argparse
+import contextlib
+import io
+import json
+import platform
+import sys
+import time
+import numpy as np
+import caching
+import functions
+import main
+import optimizer
+
+LEVY_DIMENSIONS = (2, 10, 100, 1000)
+RESTART_COUNT = 4
+REPEAT_COUNT = 3
+SEED = 2024
+TIME_TOLERANCE = 0.10
+TIME_FLOOR = 0.005
+
+def dimensions(suggested_dimension, levy_dimensions):
+    if suggested_dimension is not None:
+        return [suggested_dimension]
+    return list(levy_dimensions)
+
+def measure(name, function, dimension, bounds, defaults, global_minimum, batched, mode, restart_count, gradient):
+    learning_rate, maximum_iterations, convergence_threshold = defaults
+    objective = caching.CachedObjective(function)
+    generator = np.random.default_rng([SEED, dimension])
+    initial_point = optimizer.sample_point(bounds, dimension, generator)
+
+    start = time.perf_counter()
+    if mode == "descend":
+        final_point, final_value, history = optimizer.descend(
+            objective, initial_point, learning_rate,
+            maximum_iterations, convergence_threshold,
+            bounds=bounds, silent=True, batched=batched, gradient=gradient
+        )
+    else:
+        with contextlib.redirect_stdout(io.StringIO()):
+            final_point, final_value, history = main.restart(
+                objective, bounds, dimension, learning_rate,
+                maximum_iterations, convergence_threshold, restart_count,
+                batched=batched, seed=SEED, gradient=gradient
+            )
+    wall_time = time.perf_counter() - start
+
+    return {
+        "case": f"{function.__name__}-{dimension}-{mode}",
+        "function": name,
+        "dimension": dimension,
+        "mode": mode,
+        "wall_time": wall_time,
+        "evaluations": objective.evaluations,
+        "iterations": len(history),
+        "final_value": float(final_value),
+        "gap": abs(float(final_value) - global_minimum),
+    }
+
+def run(levy_dimensions, restart_count, gradient, repeat_count):
+    cases = []
+    for name, suggested_dimension, function, bounds, defaults, global_minimum, batched in functions.AVAILABLE:
+        for dimension in dimensions(suggested_dimension, levy_dimensions):
+            for mode in ("descend", "restart"):
+                repetitions = [
+                    measure(
+                        name, function, dimension, bounds, defaults, global_minimum,
+                        batched, mode, restart_count, gradient
+                    )
+                    for _ in range(repeat_count)
+                ]
+                case = min(repetitions, key=lambda repetition: repetition["wall_time"])
+                print(f" {case['case']}: {case['wall_time']:.4f} s, {case['evaluations']} evaluaciones, "
+                      f"{case['iterations']} iteraciones, brecha = {case['gap']:.6g}")
+                cases.append(case)
+    return cases
+
+def compare(cases, baseline_cases, time_tolerance, time_floor=TIME_FLOOR):
+    baseline = {case["case"]: case for case in baseline_cases}
+    regressions = []
+    for case in cases:
+        reference = baseline.get(case["case"])
+        if reference is None:
+            continue
+        slowdown = case["wall_time"] - reference["wall_time"]
+        if slowdown > time_floor and case["wall_time"] > reference["wall_time"] * (1 + time_tolerance):
+            regressions.append(f"{case['case']}: tiempo {reference['wall_time']:.4f} s -> {case['wall_time']:.4f} s")
+        if case["evaluations"] > reference["evaluations"]:
+            regressions.append(f"{case['case']}: evaluaciones {reference['evaluations']} -> {case['evaluations']}")
+        if case["gap"] > reference["gap"] + functions.TOLERANCE:
+            regressions.append(f"{case['case']}: brecha {reference['gap']:.6g} -> {case['gap']:.6g}")
+    return regressions
+
+def parse_arguments(arguments):
+    parser = argparse.ArgumentParser(description="Benchmark de gradiente descendente sobre functions.AVAILABLE.")
+    parser.add_argument("--output", default="benchmark.json", help="archivo JSON de resultados")
+    parser.add_argument("--compare", help="archivo JSON de referencia para detectar regresiones")
+    parser.add_argument("--dimensions", type=int, nargs="+", default=list(LEVY_DIMENSIONS), help="dimensiones para Levy")
+    parser.add_argument("--restarts", type=int, default=RESTART_COUNT, help="reinicios aleatorios por caso")
+    parser.add_argument("--repeat", type=int, default=REPEAT_COUNT, help="repeticiones por caso (se reporta el menor tiempo)")
+    parser.add_argument("--gradient", choices=optimizer.GRADIENTS, default="finite", help="método de gradiente")
+    parser.add_argument("--time-tolerance", type=float, default=TIME_TOLERANCE, help="holgura relativa de tiempo")
+    parser.add_argument("--time-floor", type=float, default=TIME_FLOOR, help="diferencia de tiempo mínima (s) para considerarla regresión")
+    return parser.parse_args(arguments)
+
+def benchmark(arguments=None):
+    options = parse_arguments(arguments)
+    cases = run(options.dimensions, options.restarts, options.gradient, options.repeat)
+
+    with open(options.output, 'w') as file:
+        json.dump({
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "gradient": options.gradient,
+            "cases": cases,
+        }, file, indent=2)
+    print(f"\n Resultados guardados en '{options.output}'")
+
+    if options.compare is None:
+        return 0
+
+    with open(options.compare) as file:
+        baseline_cases = json.load(file)["cases"]
+    regressions = compare(cases, baseline_cases, options.time_tolerance, options.time_floor)
+    if not regressions:
+        print(" Sin regresiones respecto a la referencia.")
+        return 0
+    print("\n Regresiones detectadas:")
+    for regression in regressions:
+        print(f"  {regression}")
+    return 1
+
+if __name__ == "__main__":
+    sys.exit(benchmark())
@@ -0,0 +1,75 @@
+from collections import OrderedDict
+import numpy as np
+
+DEFAULT_CAPACITY = 256
+MAXIMUM_BYTES = 64 * 2 ** 20
+
+class CachedObjective:
+    def __init__(self, objective, capacity=DEFAULT_CAPACITY, maximum_bytes=MAXIMUM_BYTES):
+        self.objective = objective
+        self.capacity = capacity
+        self.maximum_bytes = maximum_bytes
+        self.entries = OrderedDict()
+        self.size = 0
+        self.evaluations = 0
+        self.hits = 0
+        self.misses = 0
+        self.uncached = 0
+
+    def direct(self, point):
+        rows = len(point) if isinstance(point, np.ndarray) and point.ndim > 1 else 1
+        self.evaluations += rows
+        self.uncached += rows
+        return self.objective(point)
+
+    def __call__(self, point):
+        if not isinstance(point, np.ndarray) or point.ndim != 1:
+            return self.direct(point)
+
+        key = (point.dtype.str, point.tobytes())
+        if key in self.entries:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            return self.entries[key]
+
+        self.misses += 1
+        self.evaluations += 1
+        value = self.objective(point)
+        if point.nbytes > self.maximum_bytes:
+            return value
+        self.entries[key] = value
+        self.size += point.nbytes
+        while len(self.entries) > self.capacity or self.size > self.maximum_bytes:
+            evicted_key, _ = self.entries.popitem(last=False)
+            self.size -= len(evicted_key[1])
+        return value
+
+    def counts(self):
+        return self.evaluations, self.hits, self.misses, self.uncached
+
+    def absorb(self, counts):
+        evaluations, hits, misses, uncached = counts
+        self.evaluations += evaluations
+        self.hits += hits
+        self.misses += misses
+        self.uncached += uncached
+
+def cache(objective, capacity=DEFAULT_CAPACITY):
+    if isinstance(objective, CachedObjective):
+        return objective
+    return CachedObjective(objective, capacity)
+
+def direct(objective):
+    if isinstance(objective, CachedObjective):
+        return objective.direct
+    return objective
+
+def unwrap(objective):
+    while isinstance(objective, CachedObjective):
+        objective = objective.objective
+    return objective
+
+def renew(objective, capacity=DEFAULT_CAPACITY):
+    if isinstance(objective, CachedObjective):
+        return CachedObjective(objective.objective, objective.capacity, objective.maximum_bytes)
+    return CachedObjective(objective, capacity)
@@ -0,0 +1,94 @@
+import queue
+import threading
+import numpy as np
+
+CHUNK_ROWS = 65536
+
+def open_array(source):
+    if isinstance(source, str):
+        return np.load(source, mmap_mode='r')
+    return source
+
+class Dataset:
+    def __init__(self, features, targets):
+        self.features = open_array(features)
+        self.targets = open_array(targets)
+        if len(self.features) != len(self.targets):
+            raise ValueError(f"Se esperaban {len(self.features)} objetivos, se recibieron {len(self.targets)}.")
+        if len(self.features) == 0:
+            raise ValueError("El conjunto de datos no tiene filas.")
+
+    @property
+    def rows(self):
+        return len(self.features)
+
+    @property
+    def dimension(self):
+        return self.features.shape[1]
+
+    def __call__(self, point):
+        total = 0.0
+        for start in range(0, self.rows, CHUNK_ROWS):
+            features = np.asarray(self.features[start:start + CHUNK_ROWS], dtype=float)
+            targets = np.asarray(self.targets[start:start + CHUNK_ROWS], dtype=float)
+            total += self.loss(point, features, targets) * len(features)
+        return total / self.rows
+
+class LeastSquares(Dataset):
+    def loss(self, point, features, targets):
+        residuals = features @ point - targets
+        return 0.5 * np.mean(residuals ** 2)
+
+    def gradient(self, point, features, targets):
+        residuals = features @ point - targets
+        return features.T @ residuals / len(features)
+
+class Logistic(Dataset):
+    def loss(self, point, features, targets):
+        scores = features @ point
+        return np.mean(np.logaddexp(0.0, scores) - targets * scores)
+
+    def gradient(self, point, features, targets):
+        probabilities = 0.5 * (1.0 + np.tanh(0.5 * (features @ point)))
+        return features.T @ (probabilities - targets) / len(features)
+
+def minibatches(dataset, batch_size, generator, prefetch=2):
+    if batch_size <= 0:
+        raise ValueError("El tamaño de lote debe ser un entero positivo.")
+    if prefetch < 1:
+        raise ValueError("prefetch debe ser un entero positivo.")
+    buffer = queue.Queue(maxsize=prefetch)
+    stop = threading.Event()
+    starts = np.arange(0, dataset.rows, batch_size)
+
+    def offer(item):
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            while True:
+                for start in generator.permutation(starts):
+                    features = np.asarray(dataset.features[start:start + batch_size], dtype=float)
+                    targets = np.asarray(dataset.targets[start:start + batch_size], dtype=float)
+                    if not offer((features, targets)):
+                        return
+        except Exception as error:
+            offer(error)
+
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+    try:
+        while True:
+            item = buffer.get()
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        producer.join()
@@ -0,0 +1,34 @@
+import argparse
+import importlib
+import json
+import sys
+import time
+import numpy as np
+
+def load(target):
+    module_name, _, function_name = target.partition(":")
+    if not function_name:
+        raise ValueError(f"'{target}' debe tener la forma modulo:funcion.")
+    return getattr(importlib.import_module(module_name), function_name)
+
+def serve(objective, delay=0.0):
+    for line in sys.stdin:
+        try:
+            point = np.array(json.loads(line), dtype=float)
+            if delay:
+                time.sleep(delay)
+            reply = {"value": float(objective(point))}
+        except Exception as error:
+            reply = {"error": str(error)}
+        sys.stdout.write(json.dumps(reply) + "\n")
+        sys.stdout.flush()
+
+def parse_arguments(arguments):
+    parser = argparse.ArgumentParser(description="Evalúa una función objetivo punto por punto sobre stdin/stdout (JSON-lines).")
+    parser.add_argument("target", help="función a evaluar, con la forma modulo:funcion (por ejemplo functions:levy)")
+    parser.add_argument("--delay", type=float, default=0.0, help="segundos de espera por evaluación, para simular una simulación costosa")
+    return parser.parse_args(arguments)
+
+if __name__ == "__main__":
+    options = parse_arguments(sys.argv[1:])
+    serve(load(options.target), options.delay)
@@ -2,48 +2,57 @@ import numpy as np
 import input_parser
 
 def cosine(point):
-    return np.cos(5 * point[0]) + 2
+    return np.cos(5 * point[..., 0]) + 2
 
 def linear(point):
-    return -2 * point[0] + 5
+    return -2 * point[..., 0] + 5
 
 def zakharov(point):
-    mixed_term = 0.5 * point[0] + 0.5 * point[1]
-    return point[0]**2 + point[1]**2 + mixed_term**2 + mixed_term**4
+    mixed_term = 0.5 * point[..., 0] + 0.5 * point[..., 1]
+    return point[..., 0]**2 + point[..., 1]**2 + mixed_term**2 + mixed_term**4
 
 def levy(point):
-    dimension = len(point)
     transformed = 1 + (point - 1) / 4
-    first_term = np.sin(np.pi * transformed[0]) ** 2
+    first_term = np.sin(np.pi * transformed[..., 0]) ** 2
 
-    summation = 0
-    for index in range(dimension - 1):
-        current = transformed[index]
-        following = transformed[index + 1]
-        summation += (current - 1) ** 2 * (1 + 10 * np.sin(np.pi * following) ** 2)
+    current = transformed[..., :-1]
+    following = transformed[..., 1:]
+    summation = np.sum((current - 1) ** 2 * (1 + 10 * np.sin(np.pi * following) ** 2), axis=-1)
 
-    last = transformed[dimension - 1]
+    last = transformed[..., -1]
     last_term = (last - 1) ** 2 * (1 + np.sin(2 * np.pi * last) ** 2)
 
     return first_term + summation + last_term
 
 AVAILABLE = [
-    ("Coseno: f(x) = cos(5x) + 2, x ∈ [-3, 3]", 1, cosine, (-3.0, 3.0), (0.07, 100, 1e-6), 1.0),
-    ("Lineal: f(x) = -2x + 5, x ∈ [0, 3]", 1, linear, (0.0, 3.0), (1.5, 10, 1e-6), -1.0),
-    ("Zakharov: f(x,y) = x² + y² + (0.5x+0.5y)² + (0.5x+0.5y)⁴, x,y ∈ [-5, 10]", 2, zakharov, (-5.0, 10.0), (0.035, 400, 1e-6), 0.0),
-    ("Levy (multivariable), x ∈ [-10, 10]", None, levy, (-10.0, 10.0), (0.5, 500, 1e-8), 0.0),
+    ("Coseno: f(x) = cos(5x) + 2, x ∈ [-3, 3]", 1, cosine, (-3.0, 3.0), (0.07, 100, 1e-6), 1.0, True),
+    ("Lineal: f(x) = -2x + 5, x ∈ [0, 3]", 1, linear, (0.0, 3.0), (1.5, 10, 1e-6), -1.0, True),
+    ("Zakharov: f(x,y) = x² + y² + (0.5x+0.5y)² + (0.5x+0.5y)⁴, x,y ∈ [-5, 10]", 2, zakharov, (-5.0, 10.0), (0.035, 400, 1e-6), 0.0, True),
+    ("Levy (multivariable), x ∈ [-10, 10]", None, levy, (-10.0, 10.0), (0.5, 500, 1e-8), 0.0, True),
 ]
 
+TOLERANCE = 0.05
+
+def reaches(value, global_minimum):
+    return abs(value - global_minimum) <= TOLERANCE
+
+def find(function_name):
+    for entry in AVAILABLE:
+        if entry[2].__name__ == function_name:
+            return entry
+    names = ", ".join(entry[2].__name__ for entry in AVAILABLE)
+    raise ValueError(f"Función desconocida '{function_name}'. Disponibles: {names}.")
+
 def select():
     print("\nFunciones disponibles:")
-    for number, (name, dimension, _, _bounds, _defaults, _minimum) in enumerate(AVAILABLE, start=1):
+    for number, (name, dimension, _, _bounds, _defaults, _minimum, _batched) in enumerate(AVAILABLE, start=1):
         hint = f" (dimensión: {dimension})" if dimension else ""
         print(f" {number}. {name}{hint}")
 
     while True:
         try:
             selection = input_parser.parse_selection(input("\nSelecciona una función (número): "), len(AVAILABLE))
-            name, dimension, function, bounds, defaults, global_minimum = AVAILABLE[selection]
-            return name, dimension, function, bounds, defaults, global_minimum
+            name, dimension, function, bounds, defaults, global_minimum, batched = AVAILABLE[selection]
+            return name, dimension, function, bounds, defaults, global_minimum, batched
         except ValueError as error:
             print(f" {error}")
\ No newline at end of file
@@ -0,0 +1,132 @@
+import numpy as np
+from collections import namedtuple
+
+IterationRecord = namedtuple(
+    'IterationRecord',
+    ['iteration', 'point', 'value', 'gradient_norm']
+)
+
+def grow(array, required):
+    if required <= len(array):
+        return array
+    capacity = max(required, 2 * len(array))
+    expanded = np.empty((capacity,) + array.shape[1:], dtype=array.dtype)
+    expanded[:len(array)] = array
+    return expanded
+
+class History:
+    def __init__(self, every=1, last=None, retain_points=True, capacity=64):
+        if every < 1:
+            raise ValueError("every debe ser un entero positivo.")
+        if last is not None and last < 1:
+            raise ValueError("last debe ser un entero positivo.")
+        self.every = every
+        self.last = last
+        self.retain_points = retain_points
+        self.count = 0
+        self.stored = 0
+        self._iterations = np.empty(capacity, dtype=np.int64)
+        self._values = np.empty(capacity)
+        self._gradient_norms = np.empty(capacity)
+        self._slots = np.empty(capacity, dtype=np.int64)
+        self._points = None
+        self._owners = None
+
+    @classmethod
+    def restore(cls, iterations, values, gradient_norms, slots, points):
+        history = cls(capacity=0)
+        history.count = len(iterations)
+        history.stored = len(points)
+        history._iterations = iterations
+        history._values = values
+        history._gradient_norms = gradient_norms
+        history._slots = slots
+        history._points = points
+        history._owners = np.flatnonzero(np.asarray(slots) >= 0)
+        return history
+
+    @property
+    def iterations(self):
+        return self._iterations[:self.count]
+
+    @property
+    def values(self):
+        return self._values[:self.count]
+
+    @property
+    def gradient_norms(self):
+        return self._gradient_norms[:self.count]
+
+    @property
+    def slots(self):
+        return self._slots[:self.count]
+
+    @property
+    def points(self):
+        if self._points is None:
+            return None
+        if self.last is None:
+            return self._points[:self.stored]
+        kept = self._slots[:self.count]
+        return self._points[kept[kept >= 0]]
+
+    def allocate(self, point):
+        capacity = self.last if self.last is not None else len(self._iterations)
+        self._points = np.empty((capacity, len(point)), dtype=point.dtype)
+        self._owners = np.empty(capacity, dtype=np.int64)
+
+    def keep(self, point):
+        if self._points is None:
+            self.allocate(point)
+
+        if self.last is None:
+            slot = self.stored
+            self._points = grow(self._points, slot + 1)
+            self._owners = grow(self._owners, slot + 1)
+        else:
+            slot = self.stored % self.last
+            if self.stored >= self.last:
+                self._slots[self._owners[slot]] = -1
+
+        self._points[slot] = point
+        self._owners[slot] = self.count
+        self.stored += 1
+        return slot
+
+    def append(self, iteration, point, value, gradient_norm):
+        index = self.count
+        self._iterations = grow(self._iterations, index + 1)
+        self._values = grow(self._values, index + 1)
+        self._gradient_norms = grow(self._gradient_norms, index + 1)
+        self._slots = grow(self._slots, index + 1)
+
+        self._iterations[index] = iteration
+        self._values[index] = value
+        self._gradient_norms[index] = gradient_norm
+        retained = point is not None and self.retain_points and index % self.every == 0
+        self._slots[index] = self.keep(point) if retained else -1
+        self.count += 1
+
+    def record(self, index):
+        slot = self._slots[index]
+        point = self._points[slot].copy() if slot >= 0 else None
+        return IterationRecord(
+            int(self._iterations[index]), point,
+            float(self._values[index]), float(self._gradient_norms[index])
+        )
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.record(position) for position in range(*index.indices(self.count))]
+        if index < 0:
+            index += self.count
+        if index < 0 or index >= self.count:
+            raise IndexError("índice fuera del historial.")
+        return self.record(index)
+
+    def __iter__(self):
+        for index in range(self.count):
+            yield self.record(index)
@@ -15,6 +15,17 @@ def parse_positive_integer(text, parameter_name):
             raise
         raise ValueError(f"'{text}' no es un entero válido para {parameter_name}.")
 
+def parse_non_negative_integer(text, parameter_name):
+    try:
+        value = int(text)
+        if value < 0:
+            raise ValueError(f"{parameter_name} debe ser un entero no negativo.")
+        return value
+    except ValueError as error:
+        if "entero no negativo" in str(error):
+            raise
+        raise ValueError(f"'{text}' no es un entero válido para {parameter_name}.")
+
 def parse_vector(text, expected_dimension):
     components = text.strip().split()
 
@@ -35,4 +46,22 @@ def parse_selection(text, maximum):
     except ValueError as error:
         if "Selección inválida" in str(error):
             raise
-        raise ValueError(f"'{text}' no es un número válido.")
\ No newline at end of file
+        raise ValueError(f"'{text}' no es un número válido.")
+
+def parse_choice(text, choices, parameter_name):
+    value = text.strip().lower()
+    if value not in choices:
+        raise ValueError(f"'{text}' no es válido para {parameter_name}. Opciones: {', '.join(choices)}.")
+    return value
+
+def parse_retention(text):
+    kind, _, amount = text.strip().lower().partition(":")
+    if kind == "all" and not amount:
+        return {}
+    if kind == "scalars" and not amount:
+        return {"retain_points": False}
+    if kind == "last" and amount:
+        return {"last": parse_positive_integer(amount, "historial last")}
+    if kind == "every" and amount:
+        return {"every": parse_positive_integer(amount, "historial every")}
+    raise ValueError(f"'{text}' no es válido para historial. Opciones: all, scalars, last:K, every:k.")
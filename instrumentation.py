@@ -0,0 +1,58 @@
+import time
+from collections import defaultdict
+from contextlib import contextmanager, nullcontext
+
+class Statistics:
+    def __init__(self, profiler=None):
+        self.profiler = profiler
+        self.timings = defaultdict(float)
+        self.calls = defaultdict(int)
+        self.halvings = []
+        self.searches = []
+        self.iterations = 0
+        self.evaluations = 0
+        self.hits = 0
+        self.misses = 0
+        self.uncached = 0
+
+    @contextmanager
+    def measure(self, phase):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[phase] += time.perf_counter() - start
+            self.calls[phase] += 1
+
+    @contextmanager
+    def profile(self):
+        if self.profiler is None:
+            yield
+            return
+        self.profiler.enable()
+        try:
+            yield
+        finally:
+            self.profiler.disable()
+
+    def count(self, before, after):
+        self.evaluations += after[0] - before[0]
+        self.hits += after[1] - before[1]
+        self.misses += after[2] - before[2]
+        self.uncached += after[3] - before[3]
+
+    def summary(self):
+        return {
+            "iterations": self.iterations,
+            "evaluations": self.evaluations,
+            "hits": self.hits,
+            "misses": self.misses,
+            "uncached": self.uncached,
+            "halvings": sum(self.halvings),
+            "searches": sum(self.searches),
+            "timings": dict(self.timings),
+            "calls": dict(self.calls),
+        }
+
+def measure(statistics, phase):
+    return nullcontext() if statistics is None else statistics.measure(phase)
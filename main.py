@@ -1,7 +1,12 @@
+import numpy as np
+import caching
 import functions
 import optimizer
+import parallel
+import storage
 import visualization
 import input_parser
+from history import History
 
 def is_within_bounds(initial_point, bounds):
     for value in initial_point:
@@ -29,6 +34,14 @@ def request_integer(prompt, default_value, parameter_name):
         except ValueError as error:
             print(f" {error}")
 
+def request_method():
+    while True:
+        try:
+            text = input(f" Método ({'/'.join(optimizer.METHODS)}, default: {optimizer.METHODS[0]}): ").strip()
+            return optimizer.METHODS[0] if not text else input_parser.parse_choice(text, optimizer.METHODS, "método")
+        except ValueError as error:
+            print(f" {error}")
+
 def configure(defaults):
     default_rate, default_iterations, default_tolerance = defaults
     print("\nConfiguración de la optimización:")
@@ -36,8 +49,9 @@ def configure(defaults):
     learning_rate = request_float(f" Tasa de aprendizaje α (default: {default_rate}): ", default_rate, "tasa de aprendizaje")
     maximum_iterations = request_integer(f" Máximo de iteraciones N (default: {default_iterations}): ", default_iterations, "máximo de iteraciones")
     convergence_threshold = request_float(f" Criterio de paro ε (default: {default_tolerance}): ", default_tolerance, "criterio de paro")
+    method = request_method()
 
-    return learning_rate, maximum_iterations, convergence_threshold
+    return learning_rate, maximum_iterations, convergence_threshold, method
 
 def locate(dimension, bounds):
     while True:
@@ -60,26 +74,64 @@ def collect_restarts():
         except ValueError as error:
             print(f" {error}")
 
-def restart(objective, bounds, dimension, learning_rate, maximum_iterations, convergence_threshold, restart_count):
+def collect_workers():
+    while True:
+        try:
+            workers_text = input("Número de procesos en paralelo (default: 1): ").strip()
+            if not workers_text:
+                return 1
+            return input_parser.parse_positive_integer(workers_text, "procesos")
+        except ValueError as error:
+            print(f" {error}")
+
+def collect_seed():
+    while True:
+        try:
+            seed_text = input("Semilla aleatoria (default: ninguna): ").strip()
+            if not seed_text:
+                return None
+            return input_parser.parse_non_negative_integer(seed_text, "semilla")
+        except ValueError as error:
+            print(f" {error}")
+
+def attempt(objective, bounds, dimension, learning_rate, maximum_iterations, convergence_threshold, batched, gradient, method, line_search, dtype, search_budget, retention, seed_sequence):
+    generator = np.random.default_rng(seed_sequence)
+    cached_objective = caching.renew(objective)
+    final_point, final_value, history = optimizer.descend(
+        cached_objective, optimizer.sample_point(bounds, dimension, generator), learning_rate,
+        maximum_iterations, convergence_threshold,
+        bounds=bounds, silent=True, batched=batched, gradient=gradient, history=History(**retention),
+        method=method, line_search=line_search, dtype=dtype, search_budget=search_budget,
+        seed=generator
+    )
+    return final_point, final_value, history, cached_objective.counts()
+
+def restart(objective, bounds, dimension, learning_rate, maximum_iterations, convergence_threshold, restart_count, batched=False, workers=1, seed=None, gradient="finite", method="steepest", line_search="halving", dtype=np.float64, search_budget=optimizer.SEARCH_BUDGET, retention=None):
     best_point = None
     best_value = float('inf')
     best_history = []
+    best_attempt = restart_count
 
-    for attempt in range(restart_count):
-        candidate_point, candidate_value, candidate_history = optimizer.descend(
-            objective, optimizer.sample_point(bounds, dimension), learning_rate,
-            maximum_iterations, convergence_threshold,
-            bounds=bounds, silent=True
-        )
+    seed_sequences = np.random.SeedSequence(seed).spawn(restart_count)
+    function = caching.unwrap(objective)
+    arguments = [
+        (function, bounds, dimension, learning_rate, maximum_iterations, convergence_threshold, batched, gradient, method, line_search, dtype, search_budget, retention or {}, seed_sequence)
+        for seed_sequence in seed_sequences
+    ]
+
+    for index, (candidate_point, candidate_value, candidate_history, counts) in parallel.stream(attempt, arguments, workers):
+        if isinstance(objective, caching.CachedObjective):
+            objective.absorb(counts)
 
-        improved = candidate_value < best_value
+        improved = (candidate_value, index) < (best_value, best_attempt)
         marker = " ← mejor hasta ahora" if improved else ""
-        print(f" Reinicio {attempt + 1}: f(x) = {candidate_value:.6f}{marker}")
+        print(f" Reinicio {index + 1}: f(x) = {candidate_value:.6f}{marker}")
 
         if improved:
             best_point = candidate_point
             best_value = candidate_value
             best_history = candidate_history
+            best_attempt = index
 
     return best_point, best_value, best_history
 
@@ -91,8 +143,7 @@ def format_record(record):
     )
 
 def announce(final_value, global_minimum):
-    tolerance = 0.05
-    reached = abs(final_value - global_minimum) <= tolerance
+    reached = functions.reaches(final_value, global_minimum)
     if reached:
         print("\n[MINIMO GLOBAL] El algoritmo alcanzo el minimo global conocido.")
         print(f" f* = {global_minimum}, resultado: f(x) = {final_value:.6f}")
@@ -116,8 +167,18 @@ def display_results(final_point, final_value, history):
     for record in history:
         print(format_record(record))
 
-def save(filepath, final_point, final_value, history):
+def report_evaluations(objective):
+    if not isinstance(objective, caching.CachedObjective):
+        return
+    evaluations, hits, misses, uncached = objective.counts()
+    print(f"\nEvaluaciones de f(x): {evaluations} (fallos de caché: {misses}, sin caché: {uncached}; aciertos en caché: {hits})")
+
+def save(filepath, final_point, final_value, history, binary=False):
     try:
+        if binary:
+            storage.save(filepath, final_point, final_value, history)
+            print(f" Resultados guardados en '{filepath}' (formato binario)")
+            return
         with open(filepath, 'w') as file:
             file.write(f"x* = {final_point}\n")
             file.write(f"f(x*) = {final_value}\n\n")
@@ -147,13 +208,14 @@ def print_banner():
     print(" EJECUTANDO OPTIMIZACIÓN...")
     print("=" * 60 + "\n")
 
-def improve(objective, bounds, dimension, learning_rate, maximum_iterations, convergence_threshold, restart_count, initial_value):
+def improve(objective, bounds, dimension, learning_rate, maximum_iterations, convergence_threshold, restart_count, initial_value, batched=False, workers=1, seed=None, method="steepest"):
     print(f"\n--- EJECUTANDO {restart_count} REINICIOS ALEATORIOS ---\n")
     print(f"  Ejecución inicial: f(x) = {initial_value:.6f}")
 
     best_point, best_value, best_history = restart(
         objective, bounds, dimension, learning_rate,
-        maximum_iterations, convergence_threshold, restart_count
+        maximum_iterations, convergence_threshold, restart_count,
+        batched=batched, workers=workers, seed=seed, method=method
     )
 
     if best_value < initial_value:
@@ -167,46 +229,55 @@ def offer_save(final_point, final_value, history):
     save_text = input("\n¿Guardar resultados en archivo? (s/n): ").strip().lower()
     if save_text != 's':
         return
-    filepath = input("Nombre del archivo (default: resultados.txt): ").strip()
-    save(filepath if filepath else "resultados.txt", final_point, final_value, history)
+    format_text = input("Formato (t = texto, b = binario; default: t): ").strip().lower()
+    binary = format_text == 'b'
+    default_filepath = "resultados" + (storage.EXTENSION if binary else ".txt")
+    filepath = input(f"Nombre del archivo (default: {default_filepath}): ").strip()
+    save(filepath if filepath else default_filepath, final_point, final_value, history, binary=binary)
 
-def offer_visualization(history, objective):
+def offer_visualization(history, objective, batched=False):
     response = input("\n¿Ver visualización gráfica? (s/n): ").strip().lower()
-    if response == 's':
-        visualization.visualize(history, objective)
+    if response != 's':
+        return
+    output = input("Archivo de imagen (PNG/SVG; vacío para mostrar en pantalla): ").strip()
+    visualization.visualize(history, objective, batched, output=output if output else None)
 
-def present(final_point, final_value, history, global_minimum, objective):
+def present(final_point, final_value, history, global_minimum, objective, batched=False):
     display_results(final_point, final_value, history)
+    report_evaluations(objective)
     announce(final_value, global_minimum)
     offer_save(final_point, final_value, history)
-    offer_visualization(history, objective)
+    offer_visualization(history, objective, batched)
 
 def main():
-    name, suggested_dimension, objective, bounds, defaults, global_minimum = functions.select()
+    name, suggested_dimension, objective, bounds, defaults, global_minimum, batched = functions.select()
+    objective = caching.CachedObjective(objective)
     print_header(name)
     dimension = resolve_dimension(suggested_dimension)
-    learning_rate, maximum_iterations, convergence_threshold = configure(defaults)
+    learning_rate, maximum_iterations, convergence_threshold, method = configure(defaults)
     initial_point = locate(dimension, bounds)
     show_details = request_details()
     restart_count = collect_restarts()
+    workers, seed = (collect_workers(), collect_seed()) if restart_count > 0 else (1, None)
 
     print_banner()
     final_point, final_value, history = optimizer.descend(
         objective, initial_point, learning_rate,
         maximum_iterations, convergence_threshold,
-        bounds=bounds, silent=not show_details
+        bounds=bounds, silent=not show_details, batched=batched, method=method
     )
 
     if restart_count > 0:
         result = improve(
             objective, bounds, dimension, learning_rate,
             maximum_iterations, convergence_threshold,
-            restart_count, final_value
+            restart_count, final_value, batched=batched,
+            workers=workers, seed=seed, method=method
         )
         if result[0] is not None:
             final_point, final_value, history = result
 
-    present(final_point, final_value, history, global_minimum, objective)
+    present(final_point, final_value, history, global_minimum, objective, batched)
 
 if __name__ == "__main__":
     main()
@@ -1,60 +1,403 @@
 import numpy as np
-from collections import namedtuple
-
-IterationRecord = namedtuple(
-    'IterationRecord',
-    ['iteration', 'point', 'value', 'gradient_norm']
-)
-
-def differentiate(objective, point, step_size=1e-8):
-    gradient = np.zeros_like(point)
-    for index in range(len(point)):
-        h = step_size * max(1.0, abs(point[index]))
-        forward_point = np.copy(point)
-        backward_point = np.copy(point)
-        forward_point[index] += h
-        backward_point[index] -= h
-        gradient[index] = (objective(forward_point) - objective(backward_point)) / (2 * h)
+from collections import deque
+from contextlib import nullcontext
+from functools import partial
+import autodiff
+import caching
+import datasets
+import instrumentation
+from history import History, IterationRecord
+
+STEP_SIZE = 1e-8
+PERTURBATION_BUDGET = 2 ** 22
+COORDINATE_BLOCK = 256
+MAXIMUM_HALVINGS = 64
+MOMENTUM = 0.9
+FIRST_DECAY = 0.9
+SECOND_DECAY = 0.999
+STABILIZER = 1e-8
+MEMORY = 10
+METHODS = ("steepest", "momentum", "nesterov", "adam", "lbfgs")
+LINE_SEARCHES = ("halving", "armijo", "wolfe")
+SEARCHING_METHODS = ("steepest", "lbfgs")
+GRADIENTS = ("finite", "automatic", "coordinates")
+SUFFICIENT_DECREASE = 1e-4
+CURVATURE = 0.9
+WARM_GROWTH = 2.0
+SEARCH_BUDGET = 20
+
+def step_for(dtype):
+    if np.dtype(dtype) == np.float64:
+        return STEP_SIZE
+    return float(np.finfo(dtype).eps) ** (1 / 3)
+
+def partials(objective, point, indices, step_size):
+    working = np.array(point, copy=True)
+    derivatives = np.empty(len(indices), dtype=working.dtype)
+    for position, index in enumerate(indices):
+        original = working[index]
+        h = step_size * max(1.0, abs(original))
+        working[index] = original + h
+        forward_value = objective(working)
+        working[index] = original - h
+        backward_value = objective(working)
+        working[index] = original
+        derivatives[position] = (forward_value - backward_value) / (2 * h)
+    return derivatives
+
+def differentiate(objective, point, step_size=None, batched=False):
+    step_size = step_for(point.dtype) if step_size is None else step_size
+    if batched:
+        return perturb(objective, point, step_size)
+    return partials(objective, point, range(len(point)), step_size)
+
+def perturb(objective, point, step_size=STEP_SIZE, indices=None):
+    dimension = point.shape[-1]
+    indices = np.arange(dimension) if indices is None else np.asarray(indices)
+    rows = point.size // dimension
+    steps = step_size * np.maximum(1.0, np.abs(point[..., indices]))
+    chunk = max(1, PERTURBATION_BUDGET // (2 * dimension * rows))
+    gradient = np.empty_like(steps)
+    for start in range(0, len(indices), chunk):
+        block = slice(start, min(start + chunk, len(indices)))
+        coordinates = indices[block]
+        width = len(coordinates)
+        positions = np.arange(width)
+        perturbations = np.repeat(point[..., np.newaxis, :], 2 * width, axis=-2)
+        perturbations[..., positions, coordinates] += steps[..., block]
+        perturbations[..., width + positions, coordinates] -= steps[..., block]
+        values = objective(perturbations.reshape(-1, dimension)).reshape(perturbations.shape[:-1])
+        gradient[..., block] = (values[..., :width] - values[..., width:]) / (2 * steps[..., block])
     return gradient
 
+class CoordinateGradient:
+    def __init__(self, block_size=COORDINATE_BLOCK, generator=None, step_size=None, batched=False):
+        self.block_size = block_size
+        self.batched = batched
+        self.generator = np.random.default_rng(generator)
+        self.step_size = step_size
+        self.table = None
+
+    def __call__(self, objective, point):
+        if point.ndim != 1:
+            raise ValueError("El gradiente por coordenadas solo admite un punto a la vez.")
+        step_size = step_for(point.dtype) if self.step_size is None else self.step_size
+        if self.table is None or len(self.table) != len(point):
+            self.table = np.zeros_like(point)
+        block = self.generator.choice(len(point), size=min(self.block_size, len(point)), replace=False)
+        if self.batched:
+            self.table[block] = perturb(objective, point, step_size, block)
+        else:
+            self.table[block] = partials(objective, point, block, step_size)
+        return self.table.copy()
+
+def resolve(method, batched=False, seed=None):
+    if callable(method):
+        return method
+    if method == "finite":
+        return partial(differentiate, batched=batched)
+    if method == "automatic":
+        return autodiff.gradient
+    if method == "coordinates":
+        return CoordinateGradient(generator=seed, batched=batched)
+    raise ValueError(f"Método de gradiente desconocido: '{method}'.")
+
 def constrain(point, bounds):
     if bounds is None:
         return point
     return np.clip(point, bounds[0], bounds[1])
 
-def sample_point(bounds, dimension):
-    return np.random.uniform(bounds[0], bounds[1], dimension).tolist()
+def sample_point(bounds, dimension, generator=None):
+    source = np.random if generator is None else generator
+    return source.uniform(bounds[0], bounds[1], dimension).tolist()
 
 def report(message, silent):
     if not silent:
         print(message)
 
-def backtrack(objective, current_point, gradient, learning_rate, current_value, bounds, threshold):
+def backtrack(objective, current_point, gradient, learning_rate, current_value, bounds, threshold, statistics=None):
     effective_rate = learning_rate
+    halvings = 0
     while True:
-        next_point = constrain(current_point - effective_rate * gradient, bounds)
+        with instrumentation.measure(statistics, "constrain"):
+            next_point = constrain(current_point - effective_rate * gradient, bounds)
         if objective(next_point) < current_value:
-            return next_point
+            break
         effective_rate *= 0.5
-        if effective_rate < threshold:
-            return next_point
+        halvings += 1
+        if effective_rate < threshold or halvings >= MAXIMUM_HALVINGS:
+            break
+    if statistics is not None:
+        statistics.halvings.append(halvings)
+    return next_point
 
-def descend(objective, initial_point, learning_rate, maximum_iterations, convergence_threshold, bounds=None, silent=False):
-    current_point = np.array(initial_point, dtype=float)
-    history = []
+def interpolate(value, slope, trials):
+    rate, trial_value = trials[-1]
+    if len(trials) == 1:
+        return -slope * rate ** 2 / (2 * (trial_value - value - slope * rate))
+
+    previous_rate, previous_value = trials[-2]
+    current_excess = trial_value - value - slope * rate
+    previous_excess = previous_value - value - slope * previous_rate
+    denominator = rate ** 2 * previous_rate ** 2 * (rate - previous_rate)
+    cubic = (previous_rate ** 2 * current_excess - rate ** 2 * previous_excess) / denominator
+    quadratic = (-previous_rate ** 3 * current_excess + rate ** 3 * previous_excess) / denominator
+    if abs(cubic) < 1e-300:
+        return -slope / (2 * quadratic)
+    return (-quadratic + np.sqrt(max(quadratic ** 2 - 3 * cubic * slope, 0.0))) / (3 * cubic)
+
+class LineSearch:
+    def __init__(self, bounds, threshold, statistics=None, wolfe=False, compute_gradient=None, budget=SEARCH_BUDGET):
+        self.bounds = bounds
+        self.threshold = threshold
+        self.statistics = statistics
+        self.wolfe = wolfe
+        self.compute_gradient = compute_gradient
+        self.budget = budget
+        self.previous_rate = None
+        self.known = None
+        self.gradient_cost = None
+
+    def initial_rate(self, maximum_rate):
+        if self.previous_rate is None:
+            return maximum_rate
+        return min(maximum_rate, WARM_GROWTH * self.previous_rate)
+
+    def shrink(self, value, slope, trials, lower, upper):
+        candidate = interpolate(value, slope, trials) if lower == 0.0 else np.nan
+        low = lower + 0.1 * (upper - lower)
+        high = lower + 0.5 * (upper - lower)
+        return high if not np.isfinite(candidate) else min(max(candidate, low), high)
+
+    def affordable(self, spent, point):
+        cost = 2 * len(point) if self.gradient_cost is None else self.gradient_cost
+        return spent + cost <= self.budget
+
+    def search(self, objective, point, direction, gradient, value, maximum_rate):
+        objective = caching.cache(objective)
+        slope = -(gradient @ direction)
+        if slope >= 0:
+            return point
+
+        rate = self.initial_rate(maximum_rate)
+        lower, upper = 0.0, None
+        trials = []
+        best_point, best_value, best_rate = point, value, None
+
+        start = objective.evaluations
+        spent = 0
+        while spent < self.budget:
+            unconstrained = point - rate * direction
+            with instrumentation.measure(self.statistics, "constrain"):
+                candidate = constrain(unconstrained, self.bounds)
+            candidate_value = objective(candidate)
+            spent = objective.evaluations - start
+            trials.append((rate, candidate_value))
+            if candidate_value < best_value:
+                best_point, best_value, best_rate = candidate, candidate_value, rate
+
+            if candidate_value > value + SUFFICIENT_DECREASE * (gradient @ (candidate - point)):
+                upper = rate
+                rate = self.shrink(value, slope, trials, lower, upper)
+            elif self.wolfe and np.array_equal(candidate, unconstrained) and self.affordable(spent, candidate):
+                candidate_gradient = self.compute_gradient(caching.direct(objective), candidate)
+                self.gradient_cost = objective.evaluations - start - spent
+                spent += self.gradient_cost
+                self.known = (candidate, candidate_gradient)
+                candidate_slope = -(candidate_gradient @ direction)
+                if abs(candidate_slope) <= CURVATURE * abs(slope):
+                    return self.accept(candidate, rate, spent)
+                if candidate_slope < 0:
+                    lower = rate
+                    rate = WARM_GROWTH * rate if upper is None else 0.5 * (lower + upper)
+                else:
+                    upper = rate
+                    rate = 0.5 * (lower + upper)
+            else:
+                return self.accept(candidate, rate, spent)
+
+            if rate < self.threshold:
+                break
+
+        if best_rate is None:
+            return self.accept(point, self.previous_rate, spent)
+        return self.accept(best_point, best_rate, spent)
+
+    def accept(self, point, rate, spent):
+        self.previous_rate = rate
+        if self.statistics is not None:
+            self.statistics.searches.append(spent)
+        return point
+
+    def known_gradient(self, point):
+        if self.known is None:
+            return None
+        known_point, known = self.known
+        return known if np.array_equal(known_point, point) else None
+
+class Steepest:
+    def __init__(self, learning_rate, bounds, threshold, statistics=None, searcher=None):
+        self.learning_rate = learning_rate
+        self.bounds = bounds
+        self.threshold = threshold
+        self.statistics = statistics
+        self.searcher = searcher
+
+    def project(self, point, displacement):
+        with instrumentation.measure(self.statistics, "constrain"):
+            return constrain(point + displacement, self.bounds)
+
+    def advance(self, objective, point, direction, gradient, value, rate):
+        if self.searcher is None:
+            return backtrack(objective, point, direction, rate, value, self.bounds, self.threshold, self.statistics)
+        return self.searcher.search(objective, point, direction, gradient, value, rate)
+
+    def step(self, objective, point, gradient, value):
+        return self.advance(objective, point, gradient, gradient, value, self.learning_rate)
+
+    def known_gradient(self, point):
+        if self.searcher is None:
+            return None
+        return self.searcher.known_gradient(point)
+
+class Momentum(Steepest):
+    def __init__(self, learning_rate, bounds, threshold, statistics=None, nesterov=False):
+        super().__init__(learning_rate, bounds, threshold, statistics)
+        self.nesterov = nesterov
+        self.velocity = None
+
+    def step(self, objective, point, gradient, value):
+        if self.velocity is None:
+            self.velocity = np.zeros_like(point)
+        self.velocity = MOMENTUM * self.velocity - self.learning_rate * gradient
+        displacement = MOMENTUM * self.velocity - self.learning_rate * gradient if self.nesterov else self.velocity
+        next_point = self.project(point, displacement)
+        if objective(next_point) > value:
+            self.velocity = np.zeros_like(point)
+            return super().step(objective, point, gradient, value)
+        self.velocity[next_point != point + displacement] = 0.0
+        return next_point
+
+class Adam(Steepest):
+    def __init__(self, learning_rate, bounds, threshold, statistics=None):
+        super().__init__(learning_rate, bounds, threshold, statistics)
+        self.count = 0
+        self.first = None
+        self.second = None
+
+    def step(self, objective, point, gradient, value):
+        if self.first is None:
+            self.first = np.zeros_like(point)
+            self.second = np.zeros_like(point)
+        self.count += 1
+        self.first = FIRST_DECAY * self.first + (1 - FIRST_DECAY) * gradient
+        self.second = SECOND_DECAY * self.second + (1 - SECOND_DECAY) * gradient ** 2
+        first_estimate = self.first / (1 - FIRST_DECAY ** self.count)
+        second_estimate = self.second / (1 - SECOND_DECAY ** self.count)
+        return self.project(point, -self.learning_rate * first_estimate / (np.sqrt(second_estimate) + STABILIZER))
+
+class LimitedMemoryBFGS(Steepest):
+    def __init__(self, learning_rate, bounds, threshold, statistics=None, searcher=None):
+        super().__init__(learning_rate, bounds, threshold, statistics, searcher)
+        self.pairs = deque(maxlen=MEMORY)
+        self.previous = None
+
+    def remember(self, point, gradient):
+        if self.previous is None:
+            return
+        previous_point, previous_gradient = self.previous
+        displacement = point - previous_point
+        change = gradient - previous_gradient
+        curvature = displacement @ change
+        if curvature > STABILIZER * np.linalg.norm(displacement) * np.linalg.norm(change):
+            self.pairs.append((displacement, change, 1.0 / curvature))
+
+    def precondition(self, gradient):
+        direction = gradient.copy()
+        coefficients = []
+        for displacement, change, inverse_curvature in reversed(self.pairs):
+            coefficient = inverse_curvature * (displacement @ direction)
+            direction -= coefficient * change
+            coefficients.append(coefficient)
+        _, latest_change, latest_inverse_curvature = self.pairs[-1]
+        direction *= 1.0 / (latest_inverse_curvature * (latest_change @ latest_change))
+        for (displacement, change, inverse_curvature), coefficient in zip(self.pairs, reversed(coefficients)):
+            direction += (coefficient - inverse_curvature * (change @ direction)) * displacement
+        return direction
+
+    def step(self, objective, point, gradient, value):
+        self.remember(point, gradient)
+        self.previous = (point.copy(), gradient.copy())
+
+        if not self.pairs:
+            return super().step(objective, point, gradient, value)
+        direction = self.precondition(gradient)
+        if direction @ gradient <= 0:
+            self.pairs.clear()
+            return super().step(objective, point, gradient, value)
+        next_point = self.advance(objective, point, direction, gradient, value, 1.0)
+        if next_point is point:
+            self.pairs.clear()
+            return super().step(objective, point, gradient, value)
+        return next_point
+
+def check_line_search(method, line_search):
+    if line_search not in LINE_SEARCHES:
+        raise ValueError(f"Búsqueda de línea desconocida: '{line_search}'.")
+    if line_search != "halving" and method not in SEARCHING_METHODS:
+        raise ValueError(f"El método '{method}' no admite la búsqueda de línea '{line_search}'.")
+
+def prepare(method, learning_rate, bounds, threshold, statistics=None, line_search="halving", compute_gradient=None, search_budget=SEARCH_BUDGET):
+    check_line_search(method, line_search)
+    searcher = None
+    if line_search != "halving":
+        searcher = LineSearch(bounds, threshold, statistics, line_search == "wolfe", compute_gradient, search_budget)
+
+    if method == "steepest":
+        return Steepest(learning_rate, bounds, threshold, statistics, searcher)
+    if method == "momentum":
+        return Momentum(learning_rate, bounds, threshold, statistics)
+    if method == "nesterov":
+        return Momentum(learning_rate, bounds, threshold, statistics, nesterov=True)
+    if method == "adam":
+        return Adam(learning_rate, bounds, threshold, statistics)
+    if method == "lbfgs":
+        return LimitedMemoryBFGS(learning_rate, bounds, threshold, statistics, searcher)
+    raise ValueError(f"Método de optimización desconocido: '{method}'.")
+
+def echo(record):
+    print(f"Iteración {record.iteration}: f(x) = {record.value:.6f}, ||g|| = {record.gradient_norm:.6f}")
+
+def halt_below(target):
+    def halt(record):
+        return record.value <= target
+    return halt
+
+def iterate(objective, initial_point, learning_rate, maximum_iterations, convergence_threshold, bounds=None, silent=False, batched=False, gradient="finite", statistics=None, method="steepest", line_search="halving", dtype=np.float64, search_budget=SEARCH_BUDGET, seed=None):
+    objective = caching.cache(objective)
+    probe = caching.direct(objective)
+    compute_gradient = resolve(gradient, batched, seed)
+    stepper = prepare(method, learning_rate, bounds, convergence_threshold, statistics, line_search, compute_gradient, search_budget)
+    current_point = np.array(initial_point, dtype=dtype)
 
     for iteration in range(maximum_iterations):
-        gradient = differentiate(objective, current_point)
-        gradient_norm = np.linalg.norm(gradient)
         current_value = objective(current_point)
-        history.append(IterationRecord(iteration, current_point.copy(), current_value, gradient_norm))
-        report(f"Iteración {iteration}: f(x) = {current_value:.6f}, ||g|| = {gradient_norm:.6f}", silent)
+        with instrumentation.measure(statistics, "gradient"):
+            gradient = stepper.known_gradient(current_point)
+            if gradient is None:
+                gradient = compute_gradient(probe, current_point)
+            gradient = gradient.astype(dtype, copy=False)
+        gradient_norm = np.linalg.norm(gradient)
+        if statistics is not None:
+            statistics.iterations += 1
+        yield IterationRecord(iteration, current_point, current_value, gradient_norm)
 
         if gradient_norm < convergence_threshold:
             report("\n Criterio de paro alcanzado (||∇f(x)|| < ε)", silent)
             break
 
-        next_point = backtrack(objective, current_point, gradient, learning_rate, current_value, bounds, convergence_threshold)
+        with instrumentation.measure(statistics, "line_search"):
+            next_point = stepper.step(objective, current_point, gradient, current_value).astype(dtype, copy=False)
         position_change = np.linalg.norm(next_point - current_point)
         if position_change < convergence_threshold:
             report("\n Posición estable (el punto ya no se mueve)", silent)
@@ -62,4 +405,116 @@ def descend(objective, initial_point, learning_rate, maximum_iterations, converg
 
         current_point = next_point
 
-    return current_point, objective(current_point), history
\ No newline at end of file
+    return current_point
+
+def descend(objective, initial_point, learning_rate, maximum_iterations, convergence_threshold, bounds=None, silent=False, batched=False, gradient="finite", history=None, callbacks=(), statistics=None, method="steepest", line_search="halving", dtype=np.float64, search_budget=SEARCH_BUDGET, seed=None):
+    objective = caching.cache(objective)
+    history = History() if history is None else history
+    callbacks = tuple(callbacks) if silent else (echo,) + tuple(callbacks)
+    stream = iterate(
+        objective, initial_point, learning_rate, maximum_iterations, convergence_threshold,
+        bounds=bounds, silent=silent, batched=batched, gradient=gradient, statistics=statistics,
+        method=method, line_search=line_search, dtype=dtype, search_budget=search_budget,
+        seed=seed
+    )
+    counts = objective.counts()
+
+    with nullcontext() if statistics is None else statistics.profile():
+        while True:
+            try:
+                record = next(stream)
+            except StopIteration as stop:
+                current_point = stop.value
+                break
+
+            history.append(*record)
+            if any([callback(record) for callback in callbacks]):
+                report("\n Detenido por un callback", silent)
+                stream.close()
+                current_point = record.point
+                break
+
+        final_value = objective(current_point)
+
+    if statistics is not None:
+        statistics.count(counts, objective.counts())
+    return current_point, final_value, history
+
+def stochastic(dataset, initial_point, learning_rate, maximum_iterations, convergence_threshold, batch_size, bounds=None, silent=False, seed=None, prefetch=2, history=None, callbacks=()):
+    history = History() if history is None else history
+    callbacks = tuple(callbacks) if silent else (echo,) + tuple(callbacks)
+    current_point = np.array(initial_point, dtype=float)
+    batches = datasets.minibatches(dataset, batch_size, np.random.default_rng(seed), prefetch)
+
+    try:
+        for iteration in range(maximum_iterations):
+            features, targets = next(batches)
+            current_value = dataset.loss(current_point, features, targets)
+            gradient = dataset.gradient(current_point, features, targets)
+            gradient_norm = np.linalg.norm(gradient)
+            record = IterationRecord(iteration, current_point, current_value, gradient_norm)
+            history.append(*record)
+
+            if any([callback(record) for callback in callbacks]):
+                report("\n Detenido por un callback", silent)
+                break
+
+            if gradient_norm < convergence_threshold:
+                report("\n Criterio de paro alcanzado (||∇f(x)|| < ε)", silent)
+                break
+
+            current_point = constrain(current_point - learning_rate * gradient, bounds)
+    finally:
+        batches.close()
+
+    return current_point, dataset(current_point), history
+
+def backtrack_lockstep(objective, current_points, gradients, learning_rate, current_values, bounds, threshold):
+    next_points = np.empty_like(current_points)
+    pending = np.arange(len(current_points))
+    effective_rate = learning_rate
+    for _ in range(MAXIMUM_HALVINGS + 1):
+        if len(pending) == 0:
+            break
+        candidates = constrain(current_points[pending] - effective_rate * gradients[pending], bounds)
+        accepted = objective(candidates) < current_values[pending]
+        next_points[pending] = candidates
+        effective_rate *= 0.5
+        if effective_rate < threshold:
+            break
+        pending = pending[~accepted]
+    return next_points
+
+def lockstep(objective, initial_points, learning_rate, maximum_iterations, convergence_threshold, bounds=None, gradient="finite"):
+    if gradient == "coordinates":
+        raise ValueError("El gradiente por coordenadas no admite descenso simultáneo de varios puntos.")
+    compute_gradient = resolve(gradient, batched=True)
+    current_points = np.array(initial_points, dtype=float)
+    active = np.ones(len(current_points), dtype=bool)
+    iterations = np.zeros(len(current_points), dtype=int)
+
+    for iteration in range(maximum_iterations):
+        rows = np.flatnonzero(active)
+        if len(rows) == 0:
+            break
+
+        points = current_points[rows]
+        gradients = compute_gradient(objective, points)
+        gradient_norms = np.linalg.norm(gradients, axis=1)
+        current_values = objective(points)
+        iterations[rows] += 1
+
+        converged = gradient_norms < convergence_threshold
+        active[rows[converged]] = False
+
+        moving = ~converged
+        next_points = backtrack_lockstep(
+            objective, points[moving], gradients[moving], learning_rate,
+            current_values[moving], bounds, convergence_threshold
+        )
+        position_changes = np.linalg.norm(next_points - points[moving], axis=1)
+        stable = position_changes < convergence_threshold
+        active[rows[moving][stable]] = False
+        current_points[rows[moving][~stable]] = next_points[~stable]
+
+    return current_points, objective(current_points), iterations
\ No newline at end of file
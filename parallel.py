@@ -0,0 +1,12 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+def stream(task, arguments, workers=1):
+    if workers <= 1:
+        for index, argument in enumerate(arguments):
+            yield index, task(*argument)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(task, *argument): index for index, argument in enumerate(arguments)}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
@@ -0,0 +1,176 @@
+import hashlib
+import inspect
+import json
+import numbers
+import os
+import struct
+from functools import lru_cache
+import numpy as np
+import autodiff
+import caching
+import main
+import optimizer
+import storage
+from history import History
+
+DIRECTORY = ".gdcache"
+MAXIMUM_BYTES = 512 * 2 ** 20
+
+def fingerprint(objective):
+    objective = caching.unwrap(objective)
+    if not inspect.isfunction(objective):
+        return None
+    try:
+        source = inspect.getsource(objective)
+    except (OSError, TypeError):
+        return None
+    return f"{objective.__module__}.{objective.__qualname__}:{source}"
+
+@lru_cache(maxsize=None)
+def version():
+    sources = [inspect.getsource(module) for module in (optimizer, autodiff, caching)]
+    sources += [inspect.getsource(main.attempt), inspect.getsource(main.restart)]
+    return hashlib.sha256("\n".join(sources).encode("utf-8")).hexdigest()
+
+def digest(kind, objective, parameters):
+    source = fingerprint(objective)
+    if source is None:
+        return None
+    content = json.dumps({
+        "kind": kind,
+        "objective": source,
+        "optimizer": version(),
+        "numpy": np.__version__,
+        "parameters": parameters,
+    }, sort_keys=True)
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+def describe_bounds(bounds):
+    return None if bounds is None else [float(bound) for bound in bounds]
+
+def describe_history(history):
+    return {"every": history.every, "last": history.last, "retain_points": history.retain_points}
+
+class ResultCache:
+    def __init__(self, directory=DIRECTORY, maximum_bytes=MAXIMUM_BYTES):
+        self.directory = directory
+        self.maximum_bytes = maximum_bytes
+        self.hits = 0
+        self.misses = 0
+        self.replayed = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, key):
+        return os.path.join(self.directory, key + storage.EXTENSION)
+
+    def fetch(self, key):
+        filepath = self.path(key)
+        try:
+            result = storage.load(filepath)
+            metadata = storage.describe(filepath)
+        except FileNotFoundError:
+            return None
+        except (ValueError, KeyError, OSError, EOFError, struct.error):
+            self.discard(filepath)
+            return None
+        os.utime(filepath)
+        return result, metadata
+
+    def store(self, key, result, metadata):
+        filepath = self.path(key)
+        temporary = f"{filepath}.{os.getpid()}.tmp"
+        storage.save(temporary, *result, metadata=metadata)
+        os.replace(temporary, filepath)
+        self.evict()
+
+    def discard(self, filepath):
+        try:
+            os.remove(filepath)
+        except FileNotFoundError:
+            pass
+
+    def entries(self):
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(storage.EXTENSION):
+                continue
+            filepath = os.path.join(self.directory, name)
+            try:
+                status = os.stat(filepath)
+            except FileNotFoundError:
+                continue
+            entries.append((status.st_mtime, status.st_size, filepath))
+        return sorted(entries)
+
+    def evict(self):
+        entries = self.entries()
+        size = sum(entry[1] for entry in entries)
+        for _, entry_size, filepath in entries:
+            if size <= self.maximum_bytes:
+                break
+            self.discard(filepath)
+            size -= entry_size
+
+    def clear(self):
+        for _, _, filepath in self.entries():
+            self.discard(filepath)
+
+    def memoize(self, key, objective, compute):
+        if key is not None:
+            entry = self.fetch(key)
+            if entry is not None:
+                result, metadata = entry
+                self.hits += 1
+                self.replayed += metadata.get("evaluations", 0)
+                return result
+        self.misses += 1
+        before = objective.evaluations
+        result = compute()
+        if key is not None:
+            self.store(key, result, {"evaluations": objective.evaluations - before})
+        return result
+
+    def descend(self, objective, initial_point, learning_rate, maximum_iterations, convergence_threshold, bounds=None, silent=False, batched=False, gradient="finite", method="steepest", line_search="halving", dtype=np.float64, search_budget=optimizer.SEARCH_BUDGET, seed=None, history=None):
+        objective = caching.cache(objective)
+        history = History() if history is None else history
+        seeded = isinstance(seed, numbers.Integral)
+        key = None
+        if seeded or gradient != "coordinates":
+            key = digest("descend", objective, {
+                "initial_point": np.asarray(initial_point, dtype=np.float64).tolist(),
+                "learning_rate": float(learning_rate),
+                "maximum_iterations": int(maximum_iterations),
+                "convergence_threshold": float(convergence_threshold),
+                "bounds": describe_bounds(bounds), "batched": bool(batched),
+                "gradient": gradient, "method": method, "line_search": line_search,
+                "dtype": np.dtype(dtype).str, "search_budget": int(search_budget),
+                "seed": int(seed) if seeded else None, "retention": describe_history(history),
+            })
+        return self.memoize(key, objective, lambda: optimizer.descend(
+            objective, initial_point, learning_rate, maximum_iterations, convergence_threshold,
+            bounds=bounds, silent=silent, batched=batched, gradient=gradient, history=history,
+            method=method, line_search=line_search, dtype=dtype, search_budget=search_budget,
+            seed=seed
+        ))
+
+    def restart(self, objective, bounds, dimension, learning_rate, maximum_iterations, convergence_threshold, restart_count, batched=False, workers=1, seed=None, gradient="finite", method="steepest", line_search="halving", dtype=np.float64, search_budget=optimizer.SEARCH_BUDGET, retention=None):
+        objective = caching.cache(objective)
+        key = None
+        if isinstance(seed, numbers.Integral):
+            key = digest("restart", objective, {
+                "dimension": int(dimension), "seed": int(seed),
+                "restart_count": int(restart_count),
+                "learning_rate": float(learning_rate),
+                "maximum_iterations": int(maximum_iterations),
+                "convergence_threshold": float(convergence_threshold),
+                "bounds": describe_bounds(bounds), "batched": bool(batched),
+                "gradient": gradient, "method": method, "line_search": line_search,
+                "dtype": np.dtype(dtype).str, "search_budget": int(search_budget),
+                "retention": describe_history(History(**(retention or {}))),
+            })
+        return self.memoize(key, objective, lambda: main.restart(
+            objective, bounds, dimension, learning_rate, maximum_iterations,
+            convergence_threshold, restart_count, batched=batched, workers=workers,
+            seed=seed, gradient=gradient, method=method, line_search=line_search,
+            dtype=dtype, search_budget=search_budget, retention=retention
+        ))
@@ -0,0 +1,157 @@
+import asyncio
+import json
+import os
+import sys
+import threading
+import numpy as np
+
+TIMEOUT = 60.0
+RETRIES = 2
+EVALUATOR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "evaluator.py")
+
+class Worker:
+    def __init__(self, process):
+        self.process = process
+
+    @classmethod
+    async def start(cls, command):
+        process = await asyncio.create_subprocess_exec(
+            *command, stdin=asyncio.subprocess.PIPE, stdout=asyncio.subprocess.PIPE
+        )
+        return cls(process)
+
+    async def evaluate(self, point):
+        self.process.stdin.write((json.dumps(point.tolist()) + "\n").encode("utf-8"))
+        await self.process.stdin.drain()
+        line = await self.process.stdout.readline()
+        if not line:
+            raise ConnectionError("El proceso evaluador terminó inesperadamente.")
+        try:
+            reply = json.loads(line)
+        except json.JSONDecodeError:
+            raise ConnectionError(f"Respuesta inválida del proceso evaluador: {line!r}")
+        if "error" in reply:
+            raise ValueError(reply["error"])
+        if "value" not in reply:
+            raise ConnectionError(f"Respuesta sin valor del proceso evaluador: {line!r}")
+        return reply["value"]
+
+    async def stop(self):
+        if self.process.returncode is None:
+            self.process.kill()
+        await self.process.wait()
+
+class SubprocessObjective:
+    def __init__(self, target, workers=4, timeout=TIMEOUT, retries=RETRIES, arguments=()):
+        self.target = target
+        self.workers = workers
+        self.timeout = timeout
+        self.retries = retries
+        self.arguments = tuple(arguments)
+        self.reset()
+
+    def reset(self):
+        self.loop = None
+        self.thread = None
+        self.slots = None
+        self.idle = []
+        self.restarts = 0
+
+    @property
+    def command(self):
+        return [sys.executable, "-u", EVALUATOR, self.target, *self.arguments]
+
+    def __getstate__(self):
+        return {
+            "target": self.target, "workers": self.workers, "timeout": self.timeout,
+            "retries": self.retries, "arguments": self.arguments,
+        }
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.reset()
+
+    def submit(self, coroutine):
+        if self.loop is None:
+            self.loop = asyncio.new_event_loop()
+            self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+            self.thread.start()
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result()
+
+    async def acquire(self):
+        if self.slots is None:
+            self.slots = asyncio.Semaphore(self.workers)
+        await self.slots.acquire()
+        if self.idle:
+            return self.idle.pop()
+        try:
+            return await Worker.start(self.command)
+        except BaseException:
+            self.slots.release()
+            raise
+
+    def release(self, worker):
+        self.idle.append(worker)
+        self.slots.release()
+
+    async def discard(self, worker):
+        self.restarts += 1
+        try:
+            await worker.stop()
+        finally:
+            self.slots.release()
+
+    async def evaluate(self, point):
+        failure = None
+        for attempt in range(self.retries + 1):
+            worker = await self.acquire()
+            healthy = False
+            try:
+                value = await asyncio.wait_for(worker.evaluate(point), self.timeout)
+                healthy = True
+                return value
+            except ValueError:
+                healthy = True
+                raise
+            except (asyncio.TimeoutError, ConnectionError, OSError) as error:
+                failure = error
+            finally:
+                if healthy:
+                    self.release(worker)
+                else:
+                    await self.discard(worker)
+        raise RuntimeError(f"La evaluación falló tras {self.retries + 1} intentos: {failure!r}")
+
+    async def gather(self, points):
+        tasks = [asyncio.ensure_future(self.evaluate(point)) for point in points]
+        try:
+            return await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    def __call__(self, point):
+        point = np.asarray(point, dtype=float)
+        values = np.array(self.submit(self.gather(point.reshape(-1, point.shape[-1]))))
+        return values[0] if point.ndim == 1 else values.reshape(point.shape[:-1])
+
+    async def shutdown(self):
+        while self.idle:
+            await self.idle.pop().stop()
+
+    def close(self):
+        if self.loop is None:
+            return
+        self.submit(self.shutdown())
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join()
+        self.loop.close()
+        self.reset()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exception):
+        self.close()
@@ -0,0 +1,106 @@
+import json
+import struct
+import numpy as np
+from history import History
+
+MAGIC = b"GDRESULT"
+VERSION = 1
+EXTENSION = ".gdr"
+ALIGNMENT = 64
+
+def align(offset):
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+def normalize(history):
+    if isinstance(history, History):
+        return history
+    converted = History()
+    for record in history:
+        converted.append(*record)
+    return converted
+
+def compact(history):
+    kept = history.slots >= 0
+    compacted = np.full(len(history), -1, dtype=np.int64)
+    compacted[kept] = np.arange(np.count_nonzero(kept))
+    return compacted
+
+def save(filepath, final_point, final_value, history, metadata=None):
+    history = normalize(history)
+    final_point = np.asarray(final_point)
+    points = history.points
+    if points is None:
+        points = np.empty((0, len(final_point)), dtype=final_point.dtype)
+
+    arrays = [
+        ("final_point", final_point),
+        ("iterations", history.iterations.astype(np.int64)),
+        ("values", history.values.astype(np.float64)),
+        ("gradient_norms", history.gradient_norms.astype(np.float64)),
+        ("slots", compact(history)),
+        ("points", np.ascontiguousarray(points)),
+    ]
+
+    layout = {}
+    offset = 0
+    for name, array in arrays:
+        layout[name] = {"offset": offset, "dtype": array.dtype.str, "shape": list(array.shape)}
+        offset = align(offset + array.nbytes)
+
+    header = json.dumps({
+        "version": VERSION,
+        "final_value": float(final_value),
+        "layout": layout,
+        "metadata": metadata or {},
+    }).encode("utf-8")
+    data_start = align(len(MAGIC) + 4 + len(header))
+
+    with open(filepath, 'wb') as file:
+        file.write(MAGIC)
+        file.write(struct.pack("<I", len(header)))
+        file.write(header)
+        for name, array in arrays:
+            file.seek(data_start + layout[name]["offset"])
+            file.write(array.tobytes())
+        file.truncate(data_start + offset)
+
+def read_header(file):
+    if file.read(len(MAGIC)) != MAGIC:
+        raise ValueError("El archivo no contiene resultados en formato binario.")
+    prefix = file.read(4)
+    if len(prefix) < 4:
+        raise ValueError("El archivo de resultados está truncado.")
+    (length,) = struct.unpack("<I", prefix)
+    encoded = file.read(length)
+    if len(encoded) < length:
+        raise ValueError("El archivo de resultados está truncado.")
+    header = json.loads(encoded.decode("utf-8"))
+    if header["version"] != VERSION:
+        raise ValueError(f"Versión de formato no soportada: {header['version']}.")
+    return header, align(len(MAGIC) + 4 + length)
+
+def describe(filepath):
+    with open(filepath, 'rb') as file:
+        header, _ = read_header(file)
+    return header.get("metadata", {})
+
+def load(filepath):
+    with open(filepath, 'rb') as file:
+        header, data_start = read_header(file)
+
+    arrays = {}
+    for name, entry in header["layout"].items():
+        shape = tuple(entry["shape"])
+        if 0 in shape:
+            arrays[name] = np.empty(shape, dtype=entry["dtype"])
+            continue
+        arrays[name] = np.memmap(
+            filepath, dtype=entry["dtype"], mode='r',
+            offset=data_start + entry["offset"], shape=shape
+        )
+
+    history = History.restore(
+        arrays["iterations"], arrays["values"], arrays["gradient_norms"],
+        arrays["slots"], arrays["points"]
+    )
+    return np.array(arrays["final_point"]), header["final_value"], history
@@ -0,0 +1,113 @@
+import argparse
+import sys
+import numpy as np
+import caching
+import functions
+import optimizer
+import parallel
+
+RATE_FACTORS = (0.125, 0.25, 0.5, 1.0, 2.0, 4.0)
+TOLERANCE_FACTORS = (0.01, 0.1, 1.0, 10.0, 100.0)
+REDUCTION = 3
+
+def grid(defaults, rates=None, tolerances=None):
+    default_rate, _, default_tolerance = defaults
+    rates = rates or [default_rate * factor for factor in RATE_FACTORS]
+    tolerances = tolerances or [default_tolerance * factor for factor in TOLERANCE_FACTORS]
+    return [(rate, tolerance) for rate in rates for tolerance in tolerances]
+
+def schedule(maximum_iterations, configuration_count, reduction):
+    rounds = 1
+    while reduction ** rounds < configuration_count:
+        rounds += 1
+    return [max(1, maximum_iterations // reduction ** (rounds - 1 - stage)) for stage in range(rounds)]
+
+def trial(function, bounds, batched, global_minimum, initial_points, learning_rate, convergence_threshold, budget):
+    objective = caching.CachedObjective(function)
+    values = []
+    for initial_point in initial_points:
+        _, final_value, _ = optimizer.descend(
+            objective, initial_point, learning_rate, budget, convergence_threshold,
+            bounds=bounds, silent=True, batched=batched
+        )
+        values.append(float(final_value))
+    return {
+        "learning_rate": learning_rate,
+        "convergence_threshold": convergence_threshold,
+        "budget": budget,
+        "value": float(np.mean(values)),
+        "evaluations": objective.evaluations,
+        "reached": all(functions.reaches(value, global_minimum) for value in values),
+    }
+
+def rank(result):
+    if result["reached"]:
+        return 0, result["evaluations"], result["value"]
+    return 1, result["value"], result["evaluations"]
+
+def search(function_name, dimension=None, rates=None, tolerances=None, starts=1, seed=None, workers=1, reduction=REDUCTION):
+    _, suggested_dimension, function, bounds, defaults, global_minimum, batched = functions.find(function_name)
+    dimension = suggested_dimension if suggested_dimension is not None else dimension
+    if dimension is None:
+        raise ValueError("dimensión es obligatorio.")
+
+    generator = np.random.default_rng(seed)
+    initial_points = [optimizer.sample_point(bounds, dimension, generator) for _ in range(starts)]
+    configurations = grid(defaults, rates, tolerances)
+    budgets = schedule(defaults[1], len(configurations), reduction)
+
+    results = []
+    reaching = []
+    for stage, budget in enumerate(budgets):
+        arguments = [
+            (function, bounds, batched, global_minimum, initial_points, rate, tolerance, budget)
+            for rate, tolerance in configurations
+        ]
+        results = [result for _, result in parallel.stream(trial, arguments, workers)]
+        results.sort(key=rank)
+        reaching.extend(result for result in results if result["reached"])
+        print(f" Ronda {stage + 1}: {len(results)} configuraciones con {budget} iteraciones; "
+              f"mejor f(x) = {results[0]['value']:.6f}")
+
+        if stage < len(budgets) - 1:
+            survivors = results[:max(1, len(results) // reduction)]
+            configurations = [(result["learning_rate"], result["convergence_threshold"]) for result in survivors]
+
+    if reaching:
+        return min(reaching, key=lambda result: result["evaluations"]), results
+    return None, results
+
+def parse_arguments(arguments):
+    parser = argparse.ArgumentParser(description="Barrido de hiperparámetros con reducción sucesiva (successive halving).")
+    parser.add_argument("function", help="nombre de la función (cosine, linear, zakharov, levy)")
+    parser.add_argument("--dimension", type=int, help="dimensión (obligatoria para levy)")
+    parser.add_argument("--rates", type=float, nargs="+", help="tasas de aprendizaje a probar")
+    parser.add_argument("--tolerances", type=float, nargs="+", help="criterios de paro ε a probar")
+    parser.add_argument("--starts", type=int, default=1, help="puntos iniciales por configuración")
+    parser.add_argument("--seed", type=int, help="semilla para los puntos iniciales")
+    parser.add_argument("--workers", type=int, default=1, help="procesos en paralelo")
+    parser.add_argument("--reduction", type=int, default=REDUCTION, help="factor de reducción por ronda")
+    return parser.parse_args(arguments)
+
+def sweep(arguments=None):
+    options = parse_arguments(arguments)
+    try:
+        best, results = search(
+            options.function, options.dimension, options.rates, options.tolerances,
+            options.starts, options.seed, options.workers, options.reduction
+        )
+    except ValueError as error:
+        print(f" {error}")
+        return 1
+
+    if best is None:
+        print("\n Ninguna configuración alcanzó el mínimo global conocido.")
+        best = results[0]
+    else:
+        print("\n Configuración con menos evaluaciones que alcanza el mínimo global:")
+    print(f"  α = {best['learning_rate']}, ε = {best['convergence_threshold']}, N = {best['budget']}")
+    print(f"  f(x) = {best['value']:.6f}, evaluaciones = {best['evaluations']}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(sweep())
@@ -0,0 +1,24 @@
+import numpy as np
+import pytest
+import autodiff
+import functions
+import optimizer
+
+def sample(entry, count, seed=1):
+    lower, upper = entry[3]
+    dimension = entry[1] if entry[1] is not None else 5
+    return np.random.default_rng(seed).uniform(lower, upper, (count, dimension))
+
+@pytest.mark.parametrize("entry", functions.AVAILABLE, ids=[entry[0] for entry in functions.AVAILABLE])
+def test_gradient_matches_finite_differences(entry):
+    function = entry[2]
+    for point in sample(entry, 4):
+        expected = optimizer.differentiate(function, point, step_size=1e-6)
+        np.testing.assert_allclose(autodiff.gradient(function, point), expected, rtol=1e-5, atol=1e-5)
+
+@pytest.mark.parametrize("entry", functions.AVAILABLE, ids=[entry[0] for entry in functions.AVAILABLE])
+def test_batched_gradient_matches_finite_differences(entry):
+    function = entry[2]
+    points = sample(entry, 6)
+    expected = optimizer.perturb(function, points, 1e-6)
+    np.testing.assert_allclose(autodiff.gradient(function, points), expected, rtol=1e-5, atol=1e-5)
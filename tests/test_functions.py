@@ -0,0 +1,18 @@
+import numpy as np
+import pytest
+import functions
+
+def dimension_of(entry):
+    return entry[1] if entry[1] is not None else 5
+
+def sample(entry, count, seed=0):
+    lower, upper = entry[3]
+    return np.random.default_rng(seed).uniform(lower, upper, (count, dimension_of(entry)))
+
+@pytest.mark.parametrize("entry", functions.AVAILABLE, ids=[entry[0] for entry in functions.AVAILABLE])
+def test_batched_matches_per_point(entry):
+    function = entry[2]
+    points = sample(entry, 16)
+    batched = function(points)
+    assert batched.shape == (16,)
+    np.testing.assert_allclose(batched, [function(point) for point in points], rtol=1e-12, atol=1e-12)
@@ -0,0 +1,20 @@
+import numpy as np
+import functions
+import optimizer
+
+def test_rows_match_descend():
+    _, _, function, bounds, defaults, _, _ = functions.find("levy")
+    learning_rate, maximum_iterations, convergence_threshold = defaults
+    initial_points = np.random.default_rng(2).uniform(-5, 5, (5, 3))
+
+    points, values, iterations = optimizer.lockstep(
+        function, initial_points, learning_rate, maximum_iterations, convergence_threshold, bounds=bounds
+    )
+    for row, initial_point in enumerate(initial_points):
+        point, value, history = optimizer.descend(
+            function, initial_point, learning_rate, maximum_iterations, convergence_threshold,
+            bounds=bounds, silent=True, batched=True
+        )
+        np.testing.assert_array_equal(points[row], point)
+        assert values[row] == value
+        assert iterations[row] == len(history)
@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+import storage
+from history import History
+
+POLICIES = [{}, {"every": 3}, {"last": 4}, {"every": 2, "last": 3}, {"retain_points": False}]
+
+def populated(policy, count=11, dimension=3):
+    history = History(**policy)
+    for iteration in range(count):
+        history.append(iteration, np.full(dimension, float(iteration)), 100.0 - iteration, 1.0 / (iteration + 1))
+    return history
+
+@pytest.mark.parametrize("policy", POLICIES, ids=[str(policy) for policy in POLICIES])
+def test_round_trip(tmp_path, policy):
+    history = populated(policy)
+    filepath = tmp_path / ("result" + storage.EXTENSION)
+    storage.save(str(filepath), np.arange(3.0), 0.25, history)
+
+    final_point, final_value, restored = storage.load(str(filepath))
+    np.testing.assert_array_equal(final_point, np.arange(3.0))
+    assert final_value == 0.25
+    assert len(restored) == len(history)
+    np.testing.assert_array_equal(restored.iterations, history.iterations)
+    np.testing.assert_array_equal(restored.values, history.values)
+    np.testing.assert_array_equal(restored.gradient_norms, history.gradient_norms)
+    for original, loaded in zip(history, restored):
+        assert (original.iteration, original.value, original.gradient_norm) == (loaded.iteration, loaded.value, loaded.gradient_norm)
+        if original.point is None:
+            assert loaded.point is None
+        else:
+            np.testing.assert_array_equal(original.point, loaded.point)
+
+def test_metadata_round_trip(tmp_path):
+    filepath = str(tmp_path / ("result" + storage.EXTENSION))
+    storage.save(filepath, np.zeros(2), 1.0, populated({}), metadata={"evaluations": 7})
+    assert storage.describe(filepath) == {"evaluations": 7}
+
+def test_truncated_file_is_rejected(tmp_path):
+    filepath = tmp_path / ("result" + storage.EXTENSION)
+    filepath.write_bytes(storage.MAGIC + b"\x01")
+    with pytest.raises(ValueError):
+        storage.load(str(filepath))
@@ -1,5 +1,37 @@
 import numpy as np
-import matplotlib.pyplot as plt
+from functools import lru_cache
+
+CHUNK_SIZE = 4096
+CACHE_SIZE = 16
+MAXIMUM_POINTS = 2000
+
+
+# Importa matplotlib solo cuando realmente se va a graficar, para que las ejecuciones
+# que nunca visualizan (lotes, barridos, benchmarks) no paguen su tiempo de carga
+def load_pyplot():
+    import matplotlib.pyplot as plt
+    return plt
+
+
+# Muestra la figura en pantalla o, si se indicó un archivo de salida, la guarda
+# (PNG, SVG, etc. según la extensión) sin bloquear y libera la figura
+def finish(plt, figure, output=None):
+    figure.tight_layout()
+    if output is None:
+        plt.show()
+        return
+    figure.savefig(output)
+    plt.close(figure)
+    print(f" Gráfica guardada en '{output}'")
+
+
+# Reduce historiales largos a lo más MAXIMUM_POINTS registros equiespaciados,
+# conservando siempre el primero y el último, para que graficar sea rápido
+def downsample(history, maximum_points=MAXIMUM_POINTS):
+    if len(history) <= maximum_points:
+        return list(history)
+    indices = np.unique(np.linspace(0, len(history) - 1, maximum_points).astype(int))
+    return [history[int(index)] for index in indices]
 
 # Gráfica reutilizable que muestra cómo f(x) disminuye a lo largo de las iteraciones;
 # extrae iteraciones y valores del historial y dibuja una línea azul con marcadores
@@ -21,29 +53,62 @@ def mark_endpoints(axis, horizontal, vertical):
     axis.plot(horizontal[-1], vertical[-1], 'r*', markersize=15, label='Final')
 
 
+# Conserva solo los registros del historial que guardaron su punto; las políticas de retención
+# pueden descartar puntos y dejar únicamente los escalares (valor y norma del gradiente)
+def trace(history):
+    return [record for record in history if record.point is not None]
+
+
+# Evalúa la función objetivo sobre un bloque de puntos (N, d); si la función admite lotes
+# la evalúa por trozos de CHUNK_SIZE filas para acotar la memoria, si no punto por punto
+def evaluate_points(objective, points, batched=False, chunk_size=CHUNK_SIZE):
+    if not batched:
+        return np.array([objective(point) for point in points], dtype=float)
+    chunks = [
+        np.atleast_1d(objective(points[start:start + chunk_size]))
+        for start in range(0, len(points), chunk_size)
+    ]
+    return np.concatenate(chunks).astype(float)
+
+
 # Evalúa la función objetivo en cada celda de una malla 2D (meshgrid);
-# recorre fila por fila y columna por columna para llenar la matriz de valores de superficie
-def evaluate_grid(objective, horizontal_grid, vertical_grid):
-    surface_values = np.zeros_like(horizontal_grid)
-    for row in range(horizontal_grid.shape[0]):
-        for column in range(horizontal_grid.shape[1]):
-            point = np.array([horizontal_grid[row, column], vertical_grid[row, column]])
-            surface_values[row, column] = objective(point)
-    return surface_values
+# aplana la malla en un bloque de puntos y reacomoda los valores con la forma de la superficie
+def evaluate_grid(objective, horizontal_grid, vertical_grid, batched=False):
+    points = np.column_stack([horizontal_grid.ravel(), vertical_grid.ravel()])
+    return evaluate_points(objective, points, batched).reshape(horizontal_grid.shape)
+
+
+# Curva f(x) de una función 1D en el intervalo dado; se guarda en caché por
+# (función, límites, resolución) para que repetir la visualización sea inmediato
+@lru_cache(maxsize=CACHE_SIZE)
+def curve(objective, lower_bound, upper_bound, resolution, batched=False):
+    domain = np.linspace(lower_bound, upper_bound, resolution)
+    return domain, evaluate_points(objective, domain[:, np.newaxis], batched)
+
+
+# Superficie f(x,y) de una función 2D sobre el rectángulo dado; igual que curve,
+# el resultado se guarda en caché por (función, límites, resolución)
+@lru_cache(maxsize=CACHE_SIZE)
+def surface(objective, lower_horizontal, upper_horizontal, lower_vertical, upper_vertical, resolution, batched=False):
+    horizontal_domain = np.linspace(lower_horizontal, upper_horizontal, resolution)
+    vertical_domain = np.linspace(lower_vertical, upper_vertical, resolution)
+    horizontal_grid, vertical_grid = np.meshgrid(horizontal_domain, vertical_domain)
+    return horizontal_grid, vertical_grid, evaluate_grid(objective, horizontal_grid, vertical_grid, batched)
 
 
 # Vista para funciones 1D: a la izquierda dibuja la curva f(x) con la trayectoria del descenso
 # superpuesta en rojo, y a la derecha muestra la gráfica de convergencia
-def plot_one_dimension(history, objective):
-    horizontal_trajectory = [record.point[0] for record in history]
-    vertical_trajectory = [record.value for record in history]
+def plot_one_dimension(history, objective, batched=False, resolution=500, output=None, trajectory=None):
+    plt = load_pyplot()
+    trajectory = trace(history) if trajectory is None else trajectory
+    horizontal_trajectory = [record.point[0] for record in trajectory]
+    vertical_trajectory = [record.value for record in trajectory]
 
     margin = 1
     lower_bound = min(horizontal_trajectory) - margin
     upper_bound = max(horizontal_trajectory) + margin
 
-    domain = np.linspace(lower_bound, upper_bound, 500)
-    function_values = [objective(np.array([point])) for point in domain]
+    domain, function_values = curve(objective, lower_bound, upper_bound, resolution, batched)
 
     figure, (function_axis, convergence_axis) = plt.subplots(1, 2, figsize=(14, 5))
 
@@ -61,16 +126,17 @@ def plot_one_dimension(history, objective):
 
     plot_convergence(convergence_axis, history)
 
-    plt.tight_layout()
-    plt.show()
+    finish(plt, figure, output)
 
 
 # Vista para funciones 2D con tres paneles: superficie 3D con la trayectoria en rojo,
 # mapa de curvas de nivel con la trayectoria superpuesta, y gráfica de convergencia
-def plot_two_dimensions(history, objective):
-    horizontal_trajectory = [record.point[0] for record in history]
-    vertical_trajectory = [record.point[1] for record in history]
-    depth_trajectory = [record.value for record in history]
+def plot_two_dimensions(history, objective, batched=False, resolution=100, output=None, trajectory=None):
+    plt = load_pyplot()
+    trajectory = trace(history) if trajectory is None else trajectory
+    horizontal_trajectory = [record.point[0] for record in trajectory]
+    vertical_trajectory = [record.point[1] for record in trajectory]
+    depth_trajectory = [record.value for record in trajectory]
 
     margin = 1
     lower_horizontal = min(horizontal_trajectory) - margin
@@ -78,10 +144,10 @@ def plot_two_dimensions(history, objective):
     lower_vertical = min(vertical_trajectory) - margin
     upper_vertical = max(vertical_trajectory) + margin
 
-    horizontal_domain = np.linspace(lower_horizontal, upper_horizontal, 100)
-    vertical_domain = np.linspace(lower_vertical, upper_vertical, 100)
-    horizontal_grid, vertical_grid = np.meshgrid(horizontal_domain, vertical_domain)
-    surface_values = evaluate_grid(objective, horizontal_grid, vertical_grid)
+    horizontal_grid, vertical_grid, surface_values = surface(
+        objective, lower_horizontal, upper_horizontal,
+        lower_vertical, upper_vertical, resolution, batched
+    )
 
     figure = plt.figure(figsize=(18, 5))
 
@@ -128,13 +194,13 @@ def plot_two_dimensions(history, objective):
     convergence_axis = figure.add_subplot(133)
     plot_convergence(convergence_axis, history, value_label="f(x,y)")
 
-    plt.tight_layout()
-    plt.show()
+    finish(plt, figure, output)
 
 
 # Para dimensiones mayores a 2 no se puede graficar la superficie, así que muestra dos paneles:
 # convergencia de f(x) a la izquierda y decaimiento de la norma del gradiente a la derecha
-def plot_high_dimension(history):
+def plot_high_dimension(history, output=None):
+    plt = load_pyplot()
     print("\n Visualización completa no disponible para más de 2 dimensiones.")
     print("Mostrando solo gráfica de convergencia...\n")
 
@@ -151,18 +217,22 @@ def plot_high_dimension(history):
     gradient_axis.set_title('Convergencia de la Norma del Gradiente', fontsize=13)
     gradient_axis.grid(True, alpha=0.3)
 
-    plt.tight_layout()
-    plt.show()
+    finish(plt, figure, output)
 
 
 # Punto de entrada de visualización: detecta la dimensión del problema a partir del historial
-# y delega a plot_one_dimension, plot_two_dimensions o plot_high_dimension según corresponda
-def visualize(history, objective):
-    dimension = len(history[0].point)
+# y delega a plot_one_dimension, plot_two_dimensions o plot_high_dimension según corresponda;
+# si el historial no guardó puntos solo se pueden mostrar las gráficas de convergencia;
+# los historiales largos se reducen antes de graficar (la trayectoria y las series escalares
+# por separado, para no perder puntos guardados) y output guarda la figura en archivo
+def visualize(history, objective, batched=False, output=None):
+    trajectory = downsample(trace(history))
+    history = downsample(history)
+    dimension = len(trajectory[0].point) if trajectory else None
 
     if dimension == 1:
-        plot_one_dimension(history, objective)
+        plot_one_dimension(history, objective, batched, output=output, trajectory=trajectory)
     elif dimension == 2:
-        plot_two_dimensions(history, objective)
+        plot_two_dimensions(history, objective, batched, output=output, trajectory=trajectory)
     else:
-        plot_high_dimension(history)
\ No newline at end of file
+        plot_high_dimension(history, output)
\ No newline at end of file